@@ -3,26 +3,63 @@ import re
 import sqlite3
 import time
 import html
+import json
+import hashlib
+import threading
 from datetime import datetime, timezone
+from urllib.parse import quote
 
 import pytz
-from flask import Flask, render_template_string, request, jsonify, url_for, make_response
+from flask import Flask, request, jsonify, url_for, make_response, g
 
 try:
     import psycopg  # type: ignore
 except Exception:
     psycopg = None
 
+try:
+    from psycopg_pool import ConnectionPool  # type: ignore
+except Exception:
+    ConnectionPool = None
+
+try:
+    from flask_compress import Compress  # type: ignore
+except Exception:
+    Compress = None
+
+try:
+    import redis  # type: ignore
+except Exception:
+    redis = None
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
 app = Flask(__name__)
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 512
 
 APP_BUILD = "v2-2026-06"
 DB_PATH = os.getenv("DB_PATH", "news.db")
 DATABASE_URL = os.getenv("DATABASE_URL")
+REDIS_URL = os.getenv("REDIS_URL")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 BRIEF_PASSWORD = os.getenv("BRIEF_PASSWORD", "badlands")
 PAGE_SIZE = 15
+MAX_API_LIMIT = 50
 CACHE_TTL = 30  # seconds
+CACHE_MAX_KEYS = 512  # searches make keys unbounded, so cap the dict
+# Server-side prepare a statement after it has run this many times on a connection
+# (0 = on first use; the statement set is a handful of module constants, so
+# every pooled connection ends up holding them all prepared anyway)
+PG_PREPARE_THRESHOLD = int(os.getenv("PG_PREPARE_THRESHOLD", "0"))
+PG_POOL_MIN = int(os.getenv("PG_POOL_MIN", "2"))
+PG_POOL_MAX = int(os.getenv("PG_POOL_MAX", "8"))  # one per gunicorn --threads (8)
+PG_POOL_TIMEOUT = float(os.getenv("PG_POOL_TIMEOUT", "5"))  # seconds to wait for a free connection
 
 try:
     from openai import OpenAI as _OpenAI
@@ -31,9 +68,10 @@ except Exception:
     _brief_client = None
 
 _cache: dict = {}
+_cache_lock = threading.Lock()
 
 # ── Topic display labels (keep in sync with collector.py) ────────────────────
-ALL_TOPICS = [
+ALL_TOPICS = (
     # People / Admin
     "Trump", "Musk / DOGE", "RFK Jr", "Epstein", "Pelosi", "Obama",
     # Domestic Politics
@@ -52,31 +90,103 @@ ALL_TOPICS = [
     "Erdogan", "Lavrov", "Congo", "Sahel", "BRICS",
     # Other
     "Nuclear", "UFO / UAP", "QAnon", "Conspiracy", "Board of Peace", "Devolution",
-]
+)
+TOTAL_TOPICS = len(ALL_TOPICS)
 
 # Curated shortlist shown in the sticky nav bar — keep this to ~15 max
-NAV_TOPICS = [
+NAV_TOPICS = (
     "Trump", "Election", "Deep State", "FBI", "DOJ",
     "Russia", "Ukraine", "Israel", "Gaza", "China",
     "Immigration", "Economy", "Bitcoin", "UFO / UAP", "Devolution",
-]
+)
 
 
 # ── Cache helpers ─────────────────────────────────────────────────────────────
 
-def _cache_get(key):
+# Optional second tier shared by every gunicorn worker, for rendered page
+# bodies only (shared=True). Entries are stored as JSON text, never pickled,
+# so whoever can write to Redis can at worst poison a page, not run code here.
+_redis = redis.Redis.from_url(REDIS_URL, socket_timeout=0.25) if redis and REDIS_URL else None
+
+
+def _redis_key(key):
+    return f"news_agg:{APP_BUILD}:{key!r}"
+
+
+def _cache_get(key, shared=False):
     item = _cache.get(key)
-    if not item:
-        return None
-    exp, val = item
-    if time.time() > exp:
+    if item:
+        exp, val = item
+        if time.time() <= exp:
+            return val
         _cache.pop(key, None)
-        return None
-    return val
+    if shared and _redis is not None:
+        try:
+            raw = _redis.get(_redis_key(key))
+        except Exception:
+            return None  # Redis down: behave like a miss
+        if raw is not None:
+            try:
+                exp, val = json.loads(raw)
+            except (ValueError, TypeError):
+                return None
+            if isinstance(val, str) and time.time() <= exp:
+                _cache_put(key, exp, val)
+                return val
+    return None
+
+
+def _cache_put(key, exp, val):
+    if len(_cache) >= CACHE_MAX_KEYS:
+        _cache_trim()
+    _cache[key] = (exp, val)
+
+
+def _cache_set(key, val, ttl=CACHE_TTL, shared=False):
+    """Cache val for ttl seconds; shared=True also writes it to Redis (str values only)."""
+    exp = time.time() + ttl
+    _cache_put(key, exp, val)
+    if shared and _redis is not None and isinstance(val, str):
+        try:
+            _redis.set(_redis_key(key), json.dumps([exp, val]), ex=ttl)
+        except Exception:
+            pass
+
+
+def _cache_trim():
+    """Drop expired entries; if that isn't enough, the ones closest to expiry."""
+    with _cache_lock:
+        now = time.time()
+        items = sorted(_cache.items(), key=lambda kv: kv[1][0])
+        for key, (exp, _) in items:
+            if exp > now and len(_cache) < CACHE_MAX_KEYS * 3 // 4:
+                break
+            _cache.pop(key, None)
+
+
+class _CompressCache:
+    """Flask-Compress backend: compressed bodies of cached pages live in _cache
+    next to the HTML, so each page is compressed once per ETag, not per hit."""
+
+    def get(self, key):
+        return _cache_get(("compressed",) + key) if key else None
+
+    def set(self, key, value):
+        # Flask-Compress calls set() after every get(), hits included; only a miss stores
+        if key and _cache_get(("compressed",) + key) is None:
+            _cache_set(("compressed",) + key, value, ttl=60)
+
 
+def _compress_cache_key(req):
+    # Only pages tagged by cacheable(); Accept-Encoding decides br vs gzip
+    etag = g.get("page_etag")
+    return (etag, req.headers.get("Accept-Encoding", "")) if etag else None
 
-def _cache_set(key, val, ttl=CACHE_TTL):
-    _cache[key] = (time.time() + ttl, val)
+
+app.config["COMPRESS_CACHE_BACKEND"] = _CompressCache
+app.config["COMPRESS_CACHE_KEY"] = _compress_cache_key
+if Compress is not None:
+    Compress(app)
 
 
 # ── DB helpers ────────────────────────────────────────────────────────────────
@@ -85,33 +195,125 @@ def using_postgres():
     return bool(DATABASE_URL)
 
 
+_pg_pool = None
+_pg_pool_lock = threading.Lock()
+_sqlite_local = threading.local()
+
+PG_CONNECT_KWARGS = {
+    "connect_timeout": 5,
+    "options": "-c statement_timeout=5000",
+    "application_name": "news_agg",
+    "prepare_threshold": PG_PREPARE_THRESHOLD,
+    "autocommit": True,
+}
+
+
+def _get_pg_pool():
+    global _pg_pool
+    if _pg_pool is None:
+        with _pg_pool_lock:
+            if _pg_pool is None:
+                # check: ping a connection on checkout so one the server dropped
+                # while idle is replaced instead of failing the request
+                check = getattr(ConnectionPool, "check_connection", None)
+                _pg_pool = ConnectionPool(
+                    DATABASE_URL, min_size=PG_POOL_MIN, max_size=PG_POOL_MAX,
+                    kwargs=PG_CONNECT_KWARGS, name="news_agg", open=True,
+                    timeout=PG_POOL_TIMEOUT, max_idle=300,
+                    **({"check": check} if check else {}),
+                )
+    return _pg_pool
+
+
+def warm_pg_pool(timeout=10.0):
+    """Open PG_POOL_MIN connections up front so the first requests after a
+    deploy don't each pay the connect/TLS/auth handshake."""
+    if not using_postgres() or psycopg is None or ConnectionPool is None:
+        return
+    try:
+        _get_pg_pool().wait(timeout=timeout)
+    except Exception as e:
+        print(f"[DB] pool warm-up: {e}")
+
+
+warm_pg_pool()
+
+
 def pg_connect():
+    """Context manager yielding a Postgres connection, borrowed from the pool when available."""
     if psycopg is None:
         raise RuntimeError("psycopg not installed")
-    conn = psycopg.connect(
-        DATABASE_URL, connect_timeout=5,
-        options="-c statement_timeout=5000",
-        application_name="news_agg",
-    )
-    conn.autocommit = True
+    if ConnectionPool is not None:
+        return _get_pg_pool().connection()
+    return psycopg.connect(DATABASE_URL, **PG_CONNECT_KWARGS)
+
+
+# Applied once per connection. WAL lets page reads run while the collector
+# commits; mmap serves hot pages without a read() per page.
+SQLITE_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-32000;
+PRAGMA busy_timeout=5000;
+"""
+
+
+def sqlite_conn():
+    """This thread's long-lived SQLite connection (opened on first use, never closed)."""
+    conn = getattr(_sqlite_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH)
+        conn.executescript(SQLITE_PRAGMAS)
+        _sqlite_local.conn = conn
     return conn
 
 
+class _RowView:
+    """Read-only mapping over a result tuple; all rows of one result share the column index."""
+    __slots__ = ("_r", "_ix")
+
+    def __init__(self, row, ix):
+        self._r = row
+        self._ix = ix
+
+    def __getitem__(self, key):
+        return self._r[self._ix[key]]
+
+    def get(self, key, default=None):
+        i = self._ix.get(key)
+        return default if i is None else self._r[i]
+
+    def keys(self):
+        return self._ix.keys()
+
+
+def _column_index(cursor):
+    return {d[0]: i for i, d in enumerate(cursor.description)}
+
+
+def _row_views(cursor):
+    ix = _column_index(cursor)
+    return [_RowView(row, ix) for row in cursor.fetchall()]
+
+
+def row_view_factory(cursor):
+    """psycopg row factory: fetchall() hands back _RowViews directly, no second pass."""
+    ix = _column_index(cursor) if cursor.description else {}
+    return lambda values: _RowView(values, ix)
+
+
 def fetch_rows(query, params=()):
     try:
         if using_postgres():
             with pg_connect() as conn:
-                with conn.cursor() as c:
+                with conn.cursor(row_factory=row_view_factory) as c:
                     c.execute(query, params)
-                    cols = [d[0] for d in c.description]
-                    return [dict(zip(cols, row)) for row in c.fetchall()]
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
+                    return c.fetchall()
+        c = sqlite_conn().cursor()
         c.execute(query, params)
-        rows = [dict(r) for r in c.fetchall()]
-        conn.close()
-        return rows
+        return _row_views(c)
     except Exception as e:
         print(f"[DB] {e}")
         return []
@@ -125,11 +327,9 @@ def fetch_one(query, params=()):
                     c.execute(query, params)
                     row = c.fetchone()
                     return row[0] if row else None
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
+        c = sqlite_conn().cursor()
         c.execute(query, params)
         row = c.fetchone()
-        conn.close()
         return row[0] if row else None
     except Exception as e:
         print(f"[DB] {e}")
@@ -138,72 +338,271 @@ def fetch_one(query, params=()):
 
 # ── Queries ───────────────────────────────────────────────────────────────────
 
-def get_stories(limit=PAGE_SIZE, page=1, search=None, topic=None):
-    offset = max(page - 1, 0) * limit
-    ck = ("stories", limit, page, search or "", topic or "", "pg" if using_postgres() else "sq")
+# Dialect bits are fixed for the life of the process, so every query below is
+# composed once at import and route code only picks one and binds params.
+ARTICLES = "public.articles" if using_postgres() else "articles"
+PH = "%s" if using_postgres() else "?"
+LIKE = "ILIKE" if using_postgres() else "LIKE"
+
+# Searchable text of an article as one expression, so a search is a single
+# predicate per row and can be served by the articles_search_trgm GIN index
+# (keep in sync with collector.init_db)
+SEARCH_DOC = "(coalesce(title,'') || ' ' || coalesce(topic,'') || ' ' || coalesce(summary,''))"
+
+# added_at as whole Unix seconds, so rendering a row is arithmetic against
+# time.time() rather than parsing a timestamp in Python
+ADDED_TS = (
+    "CAST(EXTRACT(EPOCH FROM added_at) AS BIGINT) AS added_ts" if using_postgres()
+    else "CAST(strftime('%s', added_at) AS INTEGER) AS added_ts"
+)
+STORY_COLS = f"id,title,link,source,topic,summary,added_at,{ADDED_TS},image_url"
+
+# Every listing comes in two forms. The OFFSET form serves ?page=N (deprecated:
+# the database still reads and discards every skipped row). The keyset form
+# takes a (added_at, id) cursor from the previous page and starts an index range
+# scan right there, so page 50 costs the same as page 1. id only breaks exact
+# timestamp ties, which keeps the order total and pages free of duplicates.
+PAGE_ORDER = "ORDER BY added_at DESC, id DESC"
+SEEK = f"added_at <= {PH} AND (added_at < {PH} OR id < {PH})"
+
+
+def _story_sql(source, where=None):
+    """(OFFSET form, keyset form) of a listing query; filter params bind first."""
+    head = f"SELECT {STORY_COLS} FROM {source}"
+    return (
+        f"{head}{f' WHERE {where}' if where else ''} {PAGE_ORDER} LIMIT {PH} OFFSET {PH}",
+        f"{head} WHERE {f'{where} AND ' if where else ''}{SEEK} {PAGE_ORDER} LIMIT {PH}",
+    )
+
+
+SQL_RECENT = _story_sql(ARTICLES)
+SQL_SEARCH = _story_sql(ARTICLES, f"{SEARCH_DOC} {LIKE} {PH} ESCAPE '\\'")
+# Postgres only: the same pages served from the articles_recent snapshot (see collector.init_db)
+RECENT_VIEW_ROWS = 2000
+SQL_RECENT_MV = _story_sql("public.articles_recent")
+SQL_TOPIC_MV = _story_sql("public.articles_recent", f"lower(topic)=lower({PH})")
+# SQLite only: token/prefix match through the articles_fts index (see collector.init_sqlite_fts)
+SQL_SEARCH_FTS = _story_sql(ARTICLES, f"id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH {PH})")
+# Postgres only: the same token/prefix match through the search_tsv GIN index (see collector.init_db)
+SQL_SEARCH_TSV = _story_sql(ARTICLES, f"search_tsv @@ to_tsquery('simple', {PH})")
+SQL_TOPIC = _story_sql(ARTICLES, f"lower(topic)=lower({PH})")
+
+
+MAX_SEARCH_LEN = 64
+
+
+def like_term(search):
+    """Build a bounded substring pattern; user-typed % and _ match literally."""
+    s = search[:MAX_SEARCH_LEN]
+    s = s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{s}%"
+
+
+def fts_query(search):
+    """Turn free text into an FTS5 query: every word must match, as a prefix."""
+    words = re.findall(r"\w+", search[:MAX_SEARCH_LEN])
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def pg_tsquery(search):
+    """The Postgres counterpart of fts_query(): every word, as a prefix."""
+    words = re.findall(r"\w+", search[:MAX_SEARCH_LEN])
+    return " & ".join(f"{w}:*" for w in words)
+
+
+_sqlite_fts_ready = False
+
+def sqlite_has_fts():
+    global _sqlite_fts_ready
+    if not _sqlite_fts_ready:
+        _sqlite_fts_ready = bool(fetch_one("SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"))
+    return _sqlite_fts_ready
+
+
+_search_tsv_ready = False
+
+def pg_has_search_tsv():
+    global _search_tsv_ready
+    if not _search_tsv_ready:
+        _search_tsv_ready = bool(fetch_one(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = 'articles' AND column_name = 'search_tsv'"
+        ))
+    return _search_tsv_ready
+
+
+_recent_view_ready = False
+
+def pg_has_recent_view():
+    global _recent_view_ready
+    if not _recent_view_ready:
+        _recent_view_ready = bool(fetch_one("SELECT to_regclass('public.articles_recent') IS NOT NULL"))
+    return _recent_view_ready
+
+
+# The view is refreshed by the collector after each feed that added rows
+VIEW_LATEST_TTL = 10  # seconds
+
+def get_recent_view_latest():
+    """Newest added_at in the articles_recent snapshot, or "" when pages are not
+    served from it (SQLite, or the view is missing)."""
+    if not using_postgres() or not pg_has_recent_view():
+        return ""
+    ck = ("view_latest",)
     cached = _cache_get(ck)
     if cached is not None:
         return cached
+    result = _iso_utc(fetch_one("SELECT MAX(added_at) FROM public.articles_recent"))
+    _cache_set(ck, result, ttl=VIEW_LATEST_TTL)
+    return result
+
+
+def _page_params(limit, offset, before):
+    """Trailing params of a listing query: the keyset cursor if given, else LIMIT/OFFSET."""
+    return (before[0], before[0], before[1], limit) if before else (limit, offset)
 
-    if using_postgres():
-        tbl = "public.articles"
-        ph = "%s"
-    else:
-        tbl = "articles"
-        ph = "?"
 
+def _page_from_recent_view(limit, offset, topic=None, before=None):
+    """Serve a shallow unfiltered/topic page from articles_recent, or None to use the base table."""
+    if not using_postgres() or offset + limit > RECENT_VIEW_ROWS or not pg_has_recent_view():
+        return None
+    seek, tail = int(bool(before)), _page_params(limit, offset, before)
     if topic:
-        q = f"SELECT title,link,source,topic,summary,added_at,image_url FROM {tbl} WHERE lower(topic)=lower({ph}) ORDER BY added_at DESC LIMIT {ph} OFFSET {ph}"
-        rows = fetch_rows(q, (topic, limit, offset))
-    elif search:
-        term = f"%{search}%"
-        like = "ILIKE" if using_postgres() else "LIKE"
-        q = f"SELECT title,link,source,topic,summary,added_at,image_url FROM {tbl} WHERE title {like} {ph} OR topic {like} {ph} OR summary {like} {ph} ORDER BY added_at DESC LIMIT {ph} OFFSET {ph}"
-        rows = fetch_rows(q, (term, term, term, limit, offset))
+        rows = fetch_rows(SQL_TOPIC_MV[seek], (topic,) + tail)
     else:
-        q = f"SELECT title,link,source,topic,summary,added_at,image_url FROM {tbl} ORDER BY added_at DESC LIMIT {ph} OFFSET {ph}"
-        rows = fetch_rows(q, (limit, offset))
+        rows = fetch_rows(SQL_RECENT_MV[seek], tail)
+    # A short page means we ran off the end of the snapshot; let the base table answer
+    return rows if len(rows) >= limit else None
 
-    _cache_set(ck, rows)
-    return rows
 
+def get_stories(limit=PAGE_SIZE, page=1, search=None, topic=None, before=None):
+    """Return (rows, has_more) for one page.
 
-def get_latest_update():
-    ck = ("latest",)
+    ``before`` is a keyset cursor from page_cursor(); when given, ``page`` is
+    ignored. One extra row is fetched to tell whether another page exists, so
+    no separate COUNT(*) is needed for pagination.
+    """
+    offset = 0 if before else max(page - 1, 0) * limit
+    # Keyed by the data version too, like page_etag(), so a page built for a new
+    # tag never reuses rows fetched before that version
+    ck = ("stories", limit, before or page, search or "", topic or "", "pg" if using_postgres() else "sq",
+          get_article_stats()[1], "" if search else get_recent_view_latest())
     cached = _cache_get(ck)
     if cached is not None:
         return cached
-    tbl = "public.articles" if using_postgres() else "articles"
-    val = fetch_one(f"SELECT MAX(added_at) FROM {tbl}")
-    if not val:
-        result = ""
+
+    fetch = limit + 1
+    seek, tail = int(bool(before)), _page_params(fetch, offset, before)
+    if topic:
+        rows = (_page_from_recent_view(fetch, offset, topic, before)
+                or fetch_rows(SQL_TOPIC[seek], (topic,) + tail))
+    elif search:
+        if using_postgres():
+            match, sql, ready = pg_tsquery(search), SQL_SEARCH_TSV, pg_has_search_tsv
+        else:
+            match, sql, ready = fts_query(search), SQL_SEARCH_FTS, sqlite_has_fts
+        if match and ready():
+            rows = fetch_rows(sql[seek], (match,) + tail)
+        else:
+            rows = fetch_rows(SQL_SEARCH[seek], (like_term(search),) + tail)
     else:
-        try:
-            dt = datetime.fromisoformat(str(val).replace("Z", "+00:00"))
-            if not dt.tzinfo:
-                dt = dt.replace(tzinfo=timezone.utc)
-            result = dt.isoformat()
-        except Exception:
-            result = str(val)
-    _cache_set(ck, result, ttl=60)
+        rows = _page_from_recent_view(fetch, offset, before=before) or fetch_rows(SQL_RECENT[seek], tail)
+
+    result = (rows[:limit], len(rows) > limit)
+    _cache_set(ck, result)
     return result
 
 
-def get_article_counts():
-    """Return total count and per-topic counts for the sidebar."""
-    ck = ("counts",)
+def page_cursor(rows):
+    """Keyset cursor (added_at, id) for the page after ``rows``, or None if empty."""
+    if not rows:
+        return None
+    last = rows[-1]
+    val = last["added_at"]
+    # Postgres hands back a datetime; SQLite stores the ISO text we compare against
+    return (val.isoformat() if isinstance(val, datetime) else str(val), last["id"])
+
+
+def parse_cursor(args):
+    """Read ?before=<iso>&before_id=<id> from a request, or None if absent.
+
+    Raises ValueError for a malformed cursor (e.g. an unencoded "+00:00" that
+    arrives as " 00:00", or a missing or non-integer before_id), so the caller
+    can reject it rather than quietly serving page 1 again.
+    """
+    before = (args.get("before") or "").strip()
+    if not before:
+        return None
+    datetime.fromisoformat(before.replace("Z", "+00:00"))
+    # int() raises on "" too: without the id the tie-break would skip rows
+    return (before, int(args.get("before_id", "")))
+
+
+def _iso_utc(val):
+    """Normalise a DB timestamp (datetime or ISO text) to an ISO-8601 UTC string."""
+    if not val:
+        return ""
+    try:
+        dt = datetime.fromisoformat(str(val).replace("Z", "+00:00"))
+        if not dt.tzinfo:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.isoformat()
+    except Exception:
+        return str(val)
+
+
+def get_article_stats():
+    """Per-topic counts for the sidebar plus the newest added_at, from one grouped scan."""
+    ck = ("stats",)
     cached = _cache_get(ck)
     if cached is not None:
         return cached
-    tbl = "public.articles" if using_postgres() else "articles"
-    rows = fetch_rows(f"SELECT topic, COUNT(*) as cnt FROM {tbl} GROUP BY topic ORDER BY cnt DESC")
-    result = {r["topic"]: r["cnt"] for r in rows}
-    _cache_set(ck, result, ttl=120)
+    rows = fetch_rows(
+        f"SELECT topic, COUNT(*) AS cnt, MAX(added_at) AS latest FROM {ARTICLES} GROUP BY topic ORDER BY cnt DESC"
+    )
+    counts = {r["topic"]: r["cnt"] for r in rows}
+    latest = max((r["latest"] for r in rows if r["latest"]), default=None)
+    result = (counts, _iso_utc(latest))
+    _cache_set(ck, result, ttl=60)
     return result
 
 
 # ── Brief DB helpers ──────────────────────────────────────────────────────────
 
+def _article_columns():
+    """Column names of the articles table, read from the catalog (takes no locks)."""
+    if using_postgres():
+        rows = fetch_rows(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = 'articles'"
+        )
+        return {r["column_name"] for r in rows}
+    return {r["name"] for r in fetch_rows("PRAGMA table_info(articles)")}
+
+
+def add_missing_columns(columns):
+    """ALTER in whichever (name, pg_type, sqlite_type) columns the table lacks.
+    ADD COLUMN IF NOT EXISTS still takes an ACCESS EXCLUSIVE lock on Postgres,
+    so every worker boot would otherwise queue behind (and block) readers."""
+    existing = _article_columns()
+    missing = [col for col in columns if col[0] not in existing]
+    if not missing:
+        return
+    if using_postgres():
+        with pg_connect() as conn:
+            with conn.cursor() as c:
+                for name, pg_type, _ in missing:
+                    c.execute(f"ALTER TABLE public.articles ADD COLUMN IF NOT EXISTS {name} {pg_type};")
+        return
+    conn = sqlite_conn()
+    for name, _, sqlite_type in missing:
+        try:
+            conn.execute(f"ALTER TABLE articles ADD COLUMN {name} {sqlite_type};")
+        except Exception:
+            pass
+    conn.commit()
+
+
 _image_col_ensured = False
 
 def ensure_image_column():
@@ -211,18 +610,7 @@ def ensure_image_column():
     if _image_col_ensured:
         return
     try:
-        if using_postgres():
-            with pg_connect() as conn:
-                with conn.cursor() as c:
-                    c.execute("ALTER TABLE public.articles ADD COLUMN IF NOT EXISTS image_url TEXT;")
-        else:
-            conn = sqlite3.connect(DB_PATH)
-            try:
-                conn.execute("ALTER TABLE articles ADD COLUMN image_url TEXT;")
-            except Exception:
-                pass
-            conn.commit()
-            conn.close()
+        add_missing_columns((("image_url", "TEXT", "TEXT"),))
     except Exception as e:
         print(f"[DB migrate image_url] {e}")
     _image_col_ensured = True
@@ -236,20 +624,7 @@ def ensure_brief_columns():
     if _brief_cols_ensured:
         return
     try:
-        if using_postgres():
-            with pg_connect() as conn:
-                with conn.cursor() as c:
-                    c.execute("ALTER TABLE public.articles ADD COLUMN IF NOT EXISTS saved_brief TEXT;")
-                    c.execute("ALTER TABLE public.articles ADD COLUMN IF NOT EXISTS briefed_at TIMESTAMPTZ;")
-        else:
-            conn = sqlite3.connect(DB_PATH)
-            for col in ["saved_brief TEXT", "briefed_at TEXT"]:
-                try:
-                    conn.execute(f"ALTER TABLE articles ADD COLUMN {col};")
-                except Exception:
-                    pass
-            conn.commit()
-            conn.close()
+        add_missing_columns((("saved_brief", "TEXT", "TEXT"), ("briefed_at", "TIMESTAMPTZ", "TEXT")))
     except Exception as e:
         print(f"[DB migrate brief cols] {e}")
     _brief_cols_ensured = True
@@ -267,23 +642,21 @@ def save_brief_to_db(link, brief_text):
                         (brief_text, briefed_at, link)
                     )
         else:
-            conn = sqlite3.connect(DB_PATH)
+            conn = sqlite_conn()
             conn.execute(
                 "UPDATE articles SET saved_brief=?, briefed_at=? WHERE link=?",
                 (brief_text, briefed_at.isoformat(), link)
             )
             conn.commit()
-            conn.close()
     except Exception as e:
         print(f"[DB save brief] {e}")
 
 
 def get_saved_briefs():
     """Return all articles that have a saved brief, newest first."""
-    tbl = "public.articles" if using_postgres() else "articles"
     return fetch_rows(
         f"SELECT title, link, source, topic, saved_brief, briefed_at "
-        f"FROM {tbl} WHERE saved_brief IS NOT NULL ORDER BY briefed_at DESC"
+        f"FROM {ARTICLES} WHERE saved_brief IS NOT NULL ORDER BY briefed_at DESC"
     )
 
 
@@ -329,25 +702,14 @@ def parse_summary(text):
     return {"summary": summary_text, "bullets": bullets[:3]}
 
 
-def _parse_dt(ts):
-    """Parse a timestamp value into a UTC-aware datetime, or None."""
-    if not ts:
-        return None
-    try:
-        if isinstance(ts, datetime):
-            return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
-        return datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
-    except Exception:
-        return None
+CST = pytz.timezone("America/Chicago")
 
 
-def time_ago(dt_utc):
-    """Return a human-friendly relative time string."""
-    if not dt_utc:
+def time_ago(ts, now=None):
+    """Return a human-friendly relative time string for a Unix timestamp."""
+    if ts is None:
         return ""
-    now = datetime.now(timezone.utc)
-    diff = now - dt_utc
-    mins = int(diff.total_seconds() / 60)
+    mins = int(((now or time.time()) - ts) / 60)
     if mins < 1:
         return "just now"
     if mins < 60:
@@ -358,16 +720,16 @@ def time_ago(dt_utc):
     days = hours // 24
     if days < 7:
         return f"{days}d ago"
-    cst = pytz.timezone("America/Chicago")
-    return dt_utc.astimezone(cst).strftime("%b %d")
+    return datetime.fromtimestamp(ts, CST).strftime("%b %d")
 
 
-def serialize_story(s):
-    dt_utc   = _parse_dt(s.get("added_at"))
+def serialize_story(s, now=None):
+    now      = now or time.time()
+    ts       = s.get("added_ts")
     topic    = (s.get("topic") or "").strip()
     parsed   = parse_summary(s.get("summary") or "")
     img      = (s.get("image_url") or "").strip()
-    age_mins = int((datetime.now(timezone.utc) - dt_utc).total_seconds() / 60) if dt_utc else 9999
+    age_mins = int((now - ts) / 60) if ts is not None else 9999
 
     return {
         "title":      (s.get("title") or "").strip(),
@@ -376,13 +738,451 @@ def serialize_story(s):
         "topic":      topic,
         "summary":    parsed["summary"],
         "bullets":    parsed["bullets"],
-        "added_at":   time_ago(dt_utc),
+        "added_at":   time_ago(ts, now),
         "image_url":  img,
         "is_breaking": age_mins < 20,   # only truly fresh stories
         "is_new":      age_mins < 90,   # under 90 min gets a subtle "new" dot
     }
 
 
+def serialize_stories(rows):
+    """Serialize a page of rows against a single clock reading."""
+    now = time.time()
+    return [serialize_story(r, now) for r in rows]
+
+
+# ── Stylesheet ────────────────────────────────────────────────────────────────
+# Served from /assets/site.css with a content-hash query string, so browsers
+# cache it indefinitely and pages don't resend it on every navigation.
+
+SITE_CSS = r"""
+/* ════════════════════════════════════════════
+   TOKENS
+════════════════════════════════════════════ */
+:root {
+  --bg:        #0b0d0f;
+  --surface:   #111418;
+  --surface2:  #161b20;
+  --surface3:  #1e2530;
+  --border:    rgba(255,255,255,.07);
+  --border2:   rgba(255,255,255,.12);
+  --text:      #f0ebe0;
+  --text2:     #b8a898;
+  --muted:     #5a6672;
+  --accent:    #c8972a;
+  --accent2:   #a87a1c;
+  --gold:      #c8972a;
+  --green:     #16a34a;
+  --shadow:    0 4px 20px rgba(0,0,0,.7);
+  --radius:    8px;
+}
+body.light {
+  --bg:        #f4f5f7;
+  --surface:   #ffffff;
+  --surface2:  #f0f2f5;
+  --surface3:  #e8eaed;
+  --border:    rgba(0,0,0,.09);
+  --border2:   rgba(0,0,0,.15);
+  --text:      #111827;
+  --text2:     #374151;
+  --muted:     #6b7280;
+  --shadow:    0 2px 12px rgba(0,0,0,.1);
+}
+
+/* ════════════════════════════════════════════
+   RESET + BASE
+════════════════════════════════════════════ */
+*, *::before, *::after { box-sizing: border-box; margin: 0; padding: 0; }
+html { scroll-behavior: smooth; }
+body {
+  font-family: "Georgia", "Times New Roman", serif;
+  background: var(--bg);
+  color: var(--text);
+  line-height: 1.5;
+}
+a { color: inherit; text-decoration: none; }
+
+/* ════════════════════════════════════════════
+   MASTHEAD
+════════════════════════════════════════════ */
+.masthead {
+  background: var(--surface);
+  border-bottom: 3px solid var(--accent);
+  position: sticky; top: 0; z-index: 100;
+  box-shadow: 0 2px 16px rgba(0,0,0,.6);
+}
+.masthead-top {
+  max-width: 1280px; margin: 0 auto;
+  padding: 12px 20px 10px;
+  display: flex; align-items: center; justify-content: space-between; gap: 16px;
+}
+.site-name {
+  font-size: 32px; font-weight: 900; letter-spacing: -1px;
+  font-family: system-ui, -apple-system, sans-serif;
+  line-height: 1;
+}
+.site-name em { color: var(--accent); font-style: normal; }
+.masthead-tagline { font-size: 11px; color: var(--muted); margin-top: 3px;
+  font-family: system-ui; letter-spacing: .04em; text-transform: uppercase; }
+.masthead-right { display: flex; align-items: center; gap: 10px; }
+.search-form { display: flex; gap: 0; }
+.search-form input {
+  padding: 8px 14px; font-size: 13px; font-family: system-ui;
+  background: var(--surface2); border: 1px solid var(--border2);
+  border-right: none; border-radius: var(--radius) 0 0 var(--radius);
+  color: var(--text); outline: none; width: 200px;
+}
+.search-form input:focus { border-color: var(--accent); }
+.search-form button {
+  padding: 8px 14px; background: var(--accent); border: none;
+  border-radius: 0 var(--radius) var(--radius) 0;
+  color: #111; font-weight: 700; font-size: 13px;
+  font-family: system-ui; cursor: pointer;
+}
+.theme-btn {
+  background: none; border: 1px solid var(--border2);
+  border-radius: var(--radius); padding: 7px 10px;
+  font-size: 15px; cursor: pointer; color: var(--text); line-height: 1;
+}
+
+/* ── Ticker ── */
+.ticker {
+  background: var(--accent);
+  overflow: hidden; white-space: nowrap;
+  font-family: system-ui; font-size: 12px; font-weight: 700;
+  letter-spacing: .03em;
+}
+.ticker-inner {
+  display: flex; align-items: stretch;
+}
+.ticker-label {
+  background: #000; color: var(--accent);
+  padding: 5px 14px; flex-shrink: 0;
+  font-size: 11px; letter-spacing: .1em;
+  display: flex; align-items: center;
+}
+.ticker-track {
+  padding: 5px 0;
+  overflow: hidden; flex: 1;
+}
+.ticker-scroll {
+  display: inline-block;
+  animation: ticker 60s linear infinite;
+  padding-left: 100%;
+}
+.ticker-scroll:hover { animation-play-state: paused; }
+.ticker-item { display: inline; margin-right: 60px; color: #111; }
+.ticker-item a { color: #111; }
+.ticker-item a:hover { text-decoration: underline; }
+@keyframes ticker { from { transform: translateX(0); } to { transform: translateX(-100%); } }
+
+/* ── Topic nav ── */
+.topic-nav {
+  background: var(--surface2);
+  border-bottom: 1px solid var(--border);
+  position: relative;
+}
+.topic-nav::after {
+  content: '';
+  position: absolute; right: 0; top: 0; bottom: 0; width: 60px;
+  background: linear-gradient(to right, transparent, var(--surface2));
+  pointer-events: none;
+}
+.topic-nav-scroll {
+  overflow-x: auto; scrollbar-width: none;
+}
+.topic-nav-scroll::-webkit-scrollbar { display: none; }
+.topic-nav-inner {
+  max-width: 1280px; margin: 0 auto;
+  padding: 0 20px;
+  display: flex; gap: 0; width: max-content; min-width: 100%;
+}
+.tnav-pill {
+  padding: 10px 16px; font-size: 12px; font-weight: 700;
+  font-family: system-ui; letter-spacing: .03em;
+  color: var(--muted); white-space: nowrap;
+  border-bottom: 3px solid transparent;
+  transition: color .15s, border-color .15s; flex-shrink: 0;
+}
+.tnav-pill:hover { color: var(--text); }
+.tnav-pill.active { color: var(--accent); border-bottom-color: var(--accent); }
+
+/* ════════════════════════════════════════════
+   PAGE WRAPPER
+════════════════════════════════════════════ */
+.page { max-width: 1280px; margin: 0 auto; padding: 24px 20px 80px; }
+
+/* ════════════════════════════════════════════
+   HERO
+════════════════════════════════════════════ */
+.hero {
+  display: grid;
+  grid-template-columns: 1fr 420px;
+  gap: 0;
+  background: var(--surface);
+  border: 1px solid var(--border2);
+  border-radius: var(--radius);
+  overflow: hidden;
+  margin-bottom: 24px;
+  box-shadow: var(--shadow);
+  min-height: 320px;
+}
+@media (max-width: 860px) { .hero { grid-template-columns: 1fr; } .hero-img { max-height: 220px; } }
+.hero-body {
+  padding: 28px 30px;
+  display: flex; flex-direction: column; justify-content: space-between;
+  border-right: 1px solid var(--border);
+}
+.hero-badges { display: flex; gap: 8px; align-items: center; margin-bottom: 14px; }
+.badge-breaking {
+  background: #c8102e; color: #fff;
+  font-size: 10px; font-weight: 900; letter-spacing: .12em;
+  padding: 3px 8px; border-radius: 3px;
+  font-family: system-ui; text-transform: uppercase;
+  animation: pulse 2s infinite;
+}
+@keyframes pulse { 0%,100%{opacity:1} 50%{opacity:.7} }
+.badge-new {
+  background: var(--green); color: #fff;
+  font-size: 10px; font-weight: 800; letter-spacing: .08em;
+  padding: 3px 8px; border-radius: 3px;
+  font-family: system-ui; text-transform: uppercase;
+}
+.badge-topic {
+  font-size: 11px; font-weight: 800; letter-spacing: .1em;
+  text-transform: uppercase; font-family: system-ui;
+}
+.hero h1 {
+  font-size: 28px; font-weight: 700; line-height: 1.25;
+  margin-bottom: 14px; color: var(--text);
+}
+.hero h1 a:hover { color: var(--accent); }
+.hero-summary {
+  font-size: 15px; color: var(--text2); line-height: 1.6;
+  margin-bottom: 20px; flex: 1;
+}
+.hero-meta {
+  font-size: 12px; color: var(--muted); font-family: system-ui;
+  display: flex; gap: 14px; align-items: center; flex-wrap: wrap;
+}
+.hero-source { font-weight: 700; color: var(--text2); }
+.hero-read {
+  display: inline-block; margin-top: 16px;
+  background: var(--accent); color: #111;
+  padding: 10px 20px; border-radius: var(--radius);
+  font-size: 13px; font-weight: 700; font-family: system-ui;
+  transition: background .15s; align-self: flex-start;
+}
+.hero-read:hover { background: var(--accent2); }
+.hero-img {
+  overflow: hidden; background: var(--surface2);
+}
+.hero-img img {
+  width: 100%; height: 100%;
+  object-fit: cover; display: block;
+  transition: transform .4s;
+}
+.hero:hover .hero-img img { transform: scale(1.03); }
+.hero-img-placeholder {
+  width: 100%; height: 100%; min-height: 280px;
+  background: linear-gradient(135deg, #111208 0%, #1a1510 50%, #0c0e12 100%);
+  display: flex; flex-direction: column; align-items: center; justify-content: center;
+  color: var(--muted); gap: 10px;
+}
+.hero-img-placeholder span { font-size: 11px; letter-spacing: .1em; text-transform: uppercase; font-family: system-ui; }
+
+/* ════════════════════════════════════════════
+   AD BANNER
+════════════════════════════════════════════ */
+.ad-banner {
+  background: var(--surface2); border: 1px dashed var(--border2);
+  border-radius: var(--radius); height: 90px;
+  display: flex; align-items: center; justify-content: center;
+  color: var(--muted); font-size: 11px; font-family: system-ui;
+  margin-bottom: 24px; letter-spacing: .05em;
+}
+
+/* ════════════════════════════════════════════
+   CONTENT GRID
+════════════════════════════════════════════ */
+.content-grid {
+  display: grid;
+  grid-template-columns: 1fr 260px;
+  gap: 24px;
+  align-items: start;
+}
+@media (max-width: 900px) { .content-grid { grid-template-columns: 1fr; } .sidebar { display: none; } }
+
+/* ── Section label ── */
+.section-label {
+  font-size: 11px; font-weight: 800; letter-spacing: .12em;
+  text-transform: uppercase; color: var(--muted);
+  font-family: system-ui; margin-bottom: 14px;
+  padding-bottom: 8px; border-bottom: 1px solid var(--border);
+  display: flex; align-items: center; justify-content: space-between;
+}
+
+/* ════════════════════════════════════════════
+   STORY CARDS (3-col grid)
+════════════════════════════════════════════ */
+.story-grid {
+  display: grid;
+  grid-template-columns: repeat(3, 1fr);
+  gap: 14px;
+}
+@media (max-width: 700px) { .story-grid { grid-template-columns: 1fr; } }
+@media (min-width: 701px) and (max-width: 1000px) { .story-grid { grid-template-columns: repeat(2, 1fr); } }
+
+.card {
+  background: var(--surface);
+  border: 1px solid var(--border);
+  border-radius: var(--radius);
+  overflow: hidden;
+  display: flex; flex-direction: column;
+  transition: border-color .2s, transform .2s, box-shadow .2s;
+  box-shadow: 0 2px 10px rgba(0,0,0,.4);
+}
+.card:hover {
+  border-color: rgba(255,255,255,.18);
+  transform: translateY(-3px);
+  box-shadow: 0 10px 30px rgba(0,0,0,.55);
+}
+
+/* card image */
+.card-img {
+  aspect-ratio: 16 / 9;
+  overflow: hidden; background: var(--surface2); flex-shrink: 0;
+}
+.card-img img {
+  width: 100%; height: 100%; object-fit: cover; display: block;
+  transition: transform .4s;
+}
+.card:hover .card-img img { transform: scale(1.05); }
+
+/* no-image card gets a colored left accent bar */
+.card.no-img { border-left: 3px solid var(--accent); }
+.card.no-img.tc-blue  { border-left-color: #3b82f6; }
+.card.no-img.tc-purple{ border-left-color: #8b5cf6; }
+.card.no-img.tc-orange{ border-left-color: #f97316; }
+.card.no-img.tc-green { border-left-color: #22c55e; }
+.card.no-img.tc-steel { border-left-color: #64748b; }
+.card.no-img.tc-sky   { border-left-color: #38bdf8; }
+.card.no-img.tc-pink  { border-left-color: #e879f9; }
+
+/* card body */
+.card-body { padding: 14px 15px 15px; display: flex; flex-direction: column; flex: 1; }
+
+/* topic badge only — no breaking badge on cards */
+.card-topic-badge {
+  display: inline-block; margin-bottom: 9px;
+  font-size: 10px; font-weight: 800; letter-spacing: .1em;
+  text-transform: uppercase; font-family: system-ui;
+}
+/* new dot — subtle indicator for fresh stories */
+.new-dot {
+  display: inline-block; width: 7px; height: 7px;
+  border-radius: 50%; background: var(--green);
+  margin-left: 6px; vertical-align: middle;
+  flex-shrink: 0;
+}
+
+.card h2 {
+  font-size: 15px; font-weight: 700; line-height: 1.38;
+  margin-bottom: 8px; color: var(--text);
+}
+.card h2 a:hover { color: var(--accent); }
+.card-summary {
+  font-size: 13px; color: var(--text2); line-height: 1.52;
+  margin-bottom: 10px; flex: 1;
+  display: -webkit-box; -webkit-line-clamp: 3; -webkit-box-orient: vertical; overflow: hidden;
+  font-family: system-ui;
+}
+.card-meta {
+  font-size: 11px; color: var(--muted); font-family: system-ui;
+  display: flex; align-items: center; gap: 8px; margin-top: auto;
+  padding-top: 10px; border-top: 1px solid var(--border);
+}
+.card-source { font-weight: 700; color: var(--text2); }
+.card-dot { color: var(--border2); }
+
+/* category color coding */
+.t-trump, .t-election, .t-deep-state, .t-deep_state,
+.t-fbi, .t-cia, .t-doj, .t-dni,
+.t-indictment, .t-impeachment, .t-corruption { color: #ef4444; }
+.t-russia, .t-ukraine, .t-zelensky, .t-nato, .t-brics { color: #60a5fa; }
+.t-israel, .t-netanyahu, .t-gaza, .t-iran,
+.t-saudi, .t-saudi-arabia { color: #a78bfa; }
+.t-china, .t-taiwan, .t-north-korea { color: #fb923c; }
+.t-bitcoin, .t-crypto, .t-cbdc,
+.t-economy, .t-federal-reserve { color: #34d399; }
+.t-military, .t-pentagon { color: #94a3b8; }
+.t-ufo { color: #e879f9; }
+.t-musk, .t-doge { color: #38bdf8; }
+
+/* ════════════════════════════════════════════
+   SIDEBAR
+════════════════════════════════════════════ */
+.sidebar-widget {
+  background: var(--surface);
+  border: 1px solid var(--border);
+  border-radius: var(--radius);
+  overflow: hidden;
+  margin-bottom: 16px;
+}
+.widget-head {
+  font-size: 11px; font-weight: 800; letter-spacing: .1em;
+  text-transform: uppercase; font-family: system-ui;
+  padding: 10px 14px; border-bottom: 1px solid var(--border);
+  color: var(--muted);
+}
+.topic-row {
+  display: flex; align-items: center; justify-content: space-between;
+  padding: 8px 14px; border-bottom: 1px solid var(--border);
+  font-size: 13px; font-family: system-ui;
+  transition: background .1s;
+}
+.topic-row:last-child { border-bottom: none; }
+.topic-row:hover { background: var(--surface2); }
+.topic-row a { color: var(--text2); font-weight: 600; }
+.topic-row a:hover { color: var(--text); }
+.topic-count {
+  font-size: 11px; color: var(--muted);
+  background: var(--surface2); padding: 2px 7px; border-radius: 999px;
+}
+.ad-rect {
+  background: var(--surface2); border: 1px dashed var(--border2);
+  border-radius: var(--radius); height: 250px;
+  display: flex; align-items: center; justify-content: center;
+  color: var(--muted); font-size: 11px; font-family: system-ui;
+  margin-bottom: 16px;
+}
+
+/* ════════════════════════════════════════════
+   LOAD MORE
+════════════════════════════════════════════ */
+.load-wrap { grid-column: 1/-1; text-align: center; margin-top: 24px; }
+#loadMore {
+  padding: 11px 32px; border-radius: var(--radius);
+  background: var(--surface); border: 1px solid var(--border2);
+  color: var(--text); font-weight: 700; font-size: 13px;
+  font-family: system-ui; cursor: pointer; transition: all .15s;
+}
+#loadMore:hover { border-color: var(--accent); color: var(--accent); }
+#loadStatus { font-size: 12px; color: var(--muted); margin-top: 8px; font-family: system-ui; }
+
+/* ════════════════════════════════════════════
+   EMPTY
+════════════════════════════════════════════ */
+.empty {
+  grid-column: 1/-1;
+  text-align: center; padding: 80px 20px;
+  color: var(--muted); font-family: system-ui;
+}
+.empty strong { display: block; font-size: 20px; margin-bottom: 8px; color: var(--text); }
+"""
+SITE_CSS_VERSION = hashlib.md5(SITE_CSS.encode()).hexdigest()[:12]
+
+
 # ── HTML template ─────────────────────────────────────────────────────────────
 
 BASE_HTML = r"""
@@ -397,433 +1197,39 @@ BASE_HTML = r"""
   <!-- Google AdSense — replace ca-pub-XXXXXXXXXXXXXXXX with your publisher ID -->
   <!-- <script async src="https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client=ca-pub-XXXXXXXXXXXXXXXX" crossorigin="anonymous"></script> -->
 
-  <style>
-    /* ════════════════════════════════════════════
-       TOKENS
-    ════════════════════════════════════════════ */
-    :root {
-      --bg:        #0b0d0f;
-      --surface:   #111418;
-      --surface2:  #161b20;
-      --surface3:  #1e2530;
-      --border:    rgba(255,255,255,.07);
-      --border2:   rgba(255,255,255,.12);
-      --text:      #f0ebe0;
-      --text2:     #b8a898;
-      --muted:     #5a6672;
-      --accent:    #c8972a;
-      --accent2:   #a87a1c;
-      --gold:      #c8972a;
-      --green:     #16a34a;
-      --shadow:    0 4px 20px rgba(0,0,0,.7);
-      --radius:    8px;
-    }
-    body.light {
-      --bg:        #f4f5f7;
-      --surface:   #ffffff;
-      --surface2:  #f0f2f5;
-      --surface3:  #e8eaed;
-      --border:    rgba(0,0,0,.09);
-      --border2:   rgba(0,0,0,.15);
-      --text:      #111827;
-      --text2:     #374151;
-      --muted:     #6b7280;
-      --shadow:    0 2px 12px rgba(0,0,0,.1);
-    }
-
-    /* ════════════════════════════════════════════
-       RESET + BASE
-    ════════════════════════════════════════════ */
-    *, *::before, *::after { box-sizing: border-box; margin: 0; padding: 0; }
-    html { scroll-behavior: smooth; }
-    body {
-      font-family: "Georgia", "Times New Roman", serif;
-      background: var(--bg);
-      color: var(--text);
-      line-height: 1.5;
-    }
-    a { color: inherit; text-decoration: none; }
-
-    /* ════════════════════════════════════════════
-       MASTHEAD
-    ════════════════════════════════════════════ */
-    .masthead {
-      background: var(--surface);
-      border-bottom: 3px solid var(--accent);
-      position: sticky; top: 0; z-index: 100;
-      box-shadow: 0 2px 16px rgba(0,0,0,.6);
-    }
-    .masthead-top {
-      max-width: 1280px; margin: 0 auto;
-      padding: 12px 20px 10px;
-      display: flex; align-items: center; justify-content: space-between; gap: 16px;
-    }
-    .site-name {
-      font-size: 32px; font-weight: 900; letter-spacing: -1px;
-      font-family: system-ui, -apple-system, sans-serif;
-      line-height: 1;
-    }
-    .site-name em { color: var(--accent); font-style: normal; }
-    .masthead-tagline { font-size: 11px; color: var(--muted); margin-top: 3px;
-      font-family: system-ui; letter-spacing: .04em; text-transform: uppercase; }
-    .masthead-right { display: flex; align-items: center; gap: 10px; }
-    .search-form { display: flex; gap: 0; }
-    .search-form input {
-      padding: 8px 14px; font-size: 13px; font-family: system-ui;
-      background: var(--surface2); border: 1px solid var(--border2);
-      border-right: none; border-radius: var(--radius) 0 0 var(--radius);
-      color: var(--text); outline: none; width: 200px;
-    }
-    .search-form input:focus { border-color: var(--accent); }
-    .search-form button {
-      padding: 8px 14px; background: var(--accent); border: none;
-      border-radius: 0 var(--radius) var(--radius) 0;
-      color: #111; font-weight: 700; font-size: 13px;
-      font-family: system-ui; cursor: pointer;
-    }
-    .theme-btn {
-      background: none; border: 1px solid var(--border2);
-      border-radius: var(--radius); padding: 7px 10px;
-      font-size: 15px; cursor: pointer; color: var(--text); line-height: 1;
-    }
-
-    /* ── Ticker ── */
-    .ticker {
-      background: var(--accent);
-      overflow: hidden; white-space: nowrap;
-      font-family: system-ui; font-size: 12px; font-weight: 700;
-      letter-spacing: .03em;
-    }
-    .ticker-inner {
-      display: flex; align-items: stretch;
-    }
-    .ticker-label {
-      background: #000; color: var(--accent);
-      padding: 5px 14px; flex-shrink: 0;
-      font-size: 11px; letter-spacing: .1em;
-      display: flex; align-items: center;
-    }
-    .ticker-track {
-      padding: 5px 0;
-      overflow: hidden; flex: 1;
-    }
-    .ticker-scroll {
-      display: inline-block;
-      animation: ticker 60s linear infinite;
-      padding-left: 100%;
-    }
-    .ticker-scroll:hover { animation-play-state: paused; }
-    .ticker-item { display: inline; margin-right: 60px; color: #111; }
-    .ticker-item a { color: #111; }
-    .ticker-item a:hover { text-decoration: underline; }
-    @keyframes ticker { from { transform: translateX(0); } to { transform: translateX(-100%); } }
-
-    /* ── Topic nav ── */
-    .topic-nav {
-      background: var(--surface2);
-      border-bottom: 1px solid var(--border);
-      position: relative;
-    }
-    .topic-nav::after {
-      content: '';
-      position: absolute; right: 0; top: 0; bottom: 0; width: 60px;
-      background: linear-gradient(to right, transparent, var(--surface2));
-      pointer-events: none;
-    }
-    .topic-nav-scroll {
-      overflow-x: auto; scrollbar-width: none;
-    }
-    .topic-nav-scroll::-webkit-scrollbar { display: none; }
-    .topic-nav-inner {
-      max-width: 1280px; margin: 0 auto;
-      padding: 0 20px;
-      display: flex; gap: 0; width: max-content; min-width: 100%;
-    }
-    .tnav-pill {
-      padding: 10px 16px; font-size: 12px; font-weight: 700;
-      font-family: system-ui; letter-spacing: .03em;
-      color: var(--muted); white-space: nowrap;
-      border-bottom: 3px solid transparent;
-      transition: color .15s, border-color .15s; flex-shrink: 0;
-    }
-    .tnav-pill:hover { color: var(--text); }
-    .tnav-pill.active { color: var(--accent); border-bottom-color: var(--accent); }
-
-    /* ════════════════════════════════════════════
-       PAGE WRAPPER
-    ════════════════════════════════════════════ */
-    .page { max-width: 1280px; margin: 0 auto; padding: 24px 20px 80px; }
-
-    /* ════════════════════════════════════════════
-       HERO
-    ════════════════════════════════════════════ */
-    .hero {
-      display: grid;
-      grid-template-columns: 1fr 420px;
-      gap: 0;
-      background: var(--surface);
-      border: 1px solid var(--border2);
-      border-radius: var(--radius);
-      overflow: hidden;
-      margin-bottom: 24px;
-      box-shadow: var(--shadow);
-      min-height: 320px;
-    }
-    @media (max-width: 860px) { .hero { grid-template-columns: 1fr; } .hero-img { max-height: 220px; } }
-    .hero-body {
-      padding: 28px 30px;
-      display: flex; flex-direction: column; justify-content: space-between;
-      border-right: 1px solid var(--border);
-    }
-    .hero-badges { display: flex; gap: 8px; align-items: center; margin-bottom: 14px; }
-    .badge-breaking {
-      background: #c8102e; color: #fff;
-      font-size: 10px; font-weight: 900; letter-spacing: .12em;
-      padding: 3px 8px; border-radius: 3px;
-      font-family: system-ui; text-transform: uppercase;
-      animation: pulse 2s infinite;
-    }
-    @keyframes pulse { 0%,100%{opacity:1} 50%{opacity:.7} }
-    .badge-new {
-      background: var(--green); color: #fff;
-      font-size: 10px; font-weight: 800; letter-spacing: .08em;
-      padding: 3px 8px; border-radius: 3px;
-      font-family: system-ui; text-transform: uppercase;
-    }
-    .badge-topic {
-      font-size: 11px; font-weight: 800; letter-spacing: .1em;
-      text-transform: uppercase; font-family: system-ui;
-    }
-    .hero h1 {
-      font-size: 28px; font-weight: 700; line-height: 1.25;
-      margin-bottom: 14px; color: var(--text);
-    }
-    .hero h1 a:hover { color: var(--accent); }
-    .hero-summary {
-      font-size: 15px; color: var(--text2); line-height: 1.6;
-      margin-bottom: 20px; flex: 1;
-    }
-    .hero-meta {
-      font-size: 12px; color: var(--muted); font-family: system-ui;
-      display: flex; gap: 14px; align-items: center; flex-wrap: wrap;
-    }
-    .hero-source { font-weight: 700; color: var(--text2); }
-    .hero-read {
-      display: inline-block; margin-top: 16px;
-      background: var(--accent); color: #111;
-      padding: 10px 20px; border-radius: var(--radius);
-      font-size: 13px; font-weight: 700; font-family: system-ui;
-      transition: background .15s; align-self: flex-start;
-    }
-    .hero-read:hover { background: var(--accent2); }
-    .hero-img {
-      overflow: hidden; background: var(--surface2);
-    }
-    .hero-img img {
-      width: 100%; height: 100%;
-      object-fit: cover; display: block;
-      transition: transform .4s;
-    }
-    .hero:hover .hero-img img { transform: scale(1.03); }
-    .hero-img-placeholder {
-      width: 100%; height: 100%; min-height: 280px;
-      background: linear-gradient(135deg, #111208 0%, #1a1510 50%, #0c0e12 100%);
-      display: flex; flex-direction: column; align-items: center; justify-content: center;
-      color: var(--muted); gap: 10px;
-    }
-    .hero-img-placeholder span { font-size: 11px; letter-spacing: .1em; text-transform: uppercase; font-family: system-ui; }
-
-    /* ════════════════════════════════════════════
-       AD BANNER
-    ════════════════════════════════════════════ */
-    .ad-banner {
-      background: var(--surface2); border: 1px dashed var(--border2);
-      border-radius: var(--radius); height: 90px;
-      display: flex; align-items: center; justify-content: center;
-      color: var(--muted); font-size: 11px; font-family: system-ui;
-      margin-bottom: 24px; letter-spacing: .05em;
-    }
-
-    /* ════════════════════════════════════════════
-       CONTENT GRID
-    ════════════════════════════════════════════ */
-    .content-grid {
-      display: grid;
-      grid-template-columns: 1fr 260px;
-      gap: 24px;
-      align-items: start;
-    }
-    @media (max-width: 900px) { .content-grid { grid-template-columns: 1fr; } .sidebar { display: none; } }
-
-    /* ── Section label ── */
-    .section-label {
-      font-size: 11px; font-weight: 800; letter-spacing: .12em;
-      text-transform: uppercase; color: var(--muted);
-      font-family: system-ui; margin-bottom: 14px;
-      padding-bottom: 8px; border-bottom: 1px solid var(--border);
-      display: flex; align-items: center; justify-content: space-between;
-    }
-
-    /* ════════════════════════════════════════════
-       STORY CARDS (3-col grid)
-    ════════════════════════════════════════════ */
-    .story-grid {
-      display: grid;
-      grid-template-columns: repeat(3, 1fr);
-      gap: 14px;
-    }
-    @media (max-width: 700px) { .story-grid { grid-template-columns: 1fr; } }
-    @media (min-width: 701px) and (max-width: 1000px) { .story-grid { grid-template-columns: repeat(2, 1fr); } }
-
-    .card {
-      background: var(--surface);
-      border: 1px solid var(--border);
-      border-radius: var(--radius);
-      overflow: hidden;
-      display: flex; flex-direction: column;
-      transition: border-color .2s, transform .2s, box-shadow .2s;
-      box-shadow: 0 2px 10px rgba(0,0,0,.4);
-    }
-    .card:hover {
-      border-color: rgba(255,255,255,.18);
-      transform: translateY(-3px);
-      box-shadow: 0 10px 30px rgba(0,0,0,.55);
-    }
-
-    /* card image */
-    .card-img {
-      aspect-ratio: 16 / 9;
-      overflow: hidden; background: var(--surface2); flex-shrink: 0;
-    }
-    .card-img img {
-      width: 100%; height: 100%; object-fit: cover; display: block;
-      transition: transform .4s;
-    }
-    .card:hover .card-img img { transform: scale(1.05); }
-
-    /* no-image card gets a colored left accent bar */
-    .card.no-img { border-left: 3px solid var(--accent); }
-    .card.no-img.tc-blue  { border-left-color: #3b82f6; }
-    .card.no-img.tc-purple{ border-left-color: #8b5cf6; }
-    .card.no-img.tc-orange{ border-left-color: #f97316; }
-    .card.no-img.tc-green { border-left-color: #22c55e; }
-    .card.no-img.tc-steel { border-left-color: #64748b; }
-    .card.no-img.tc-sky   { border-left-color: #38bdf8; }
-    .card.no-img.tc-pink  { border-left-color: #e879f9; }
-
-    /* card body */
-    .card-body { padding: 14px 15px 15px; display: flex; flex-direction: column; flex: 1; }
-
-    /* topic badge only — no breaking badge on cards */
-    .card-topic-badge {
-      display: inline-block; margin-bottom: 9px;
-      font-size: 10px; font-weight: 800; letter-spacing: .1em;
-      text-transform: uppercase; font-family: system-ui;
-    }
-    /* new dot — subtle indicator for fresh stories */
-    .new-dot {
-      display: inline-block; width: 7px; height: 7px;
-      border-radius: 50%; background: var(--green);
-      margin-left: 6px; vertical-align: middle;
-      flex-shrink: 0;
-    }
-
-    .card h2 {
-      font-size: 15px; font-weight: 700; line-height: 1.38;
-      margin-bottom: 8px; color: var(--text);
-    }
-    .card h2 a:hover { color: var(--accent); }
-    .card-summary {
-      font-size: 13px; color: var(--text2); line-height: 1.52;
-      margin-bottom: 10px; flex: 1;
-      display: -webkit-box; -webkit-line-clamp: 3; -webkit-box-orient: vertical; overflow: hidden;
-      font-family: system-ui;
-    }
-    .card-meta {
-      font-size: 11px; color: var(--muted); font-family: system-ui;
-      display: flex; align-items: center; gap: 8px; margin-top: auto;
-      padding-top: 10px; border-top: 1px solid var(--border);
-    }
-    .card-source { font-weight: 700; color: var(--text2); }
-    .card-dot { color: var(--border2); }
-
-    /* category color coding */
-    .t-trump, .t-election, .t-deep-state, .t-deep_state,
-    .t-fbi, .t-cia, .t-doj, .t-dni,
-    .t-indictment, .t-impeachment, .t-corruption { color: #ef4444; }
-    .t-russia, .t-ukraine, .t-zelensky, .t-nato, .t-brics { color: #60a5fa; }
-    .t-israel, .t-netanyahu, .t-gaza, .t-iran,
-    .t-saudi, .t-saudi-arabia { color: #a78bfa; }
-    .t-china, .t-taiwan, .t-north-korea { color: #fb923c; }
-    .t-bitcoin, .t-crypto, .t-cbdc,
-    .t-economy, .t-federal-reserve { color: #34d399; }
-    .t-military, .t-pentagon { color: #94a3b8; }
-    .t-ufo { color: #e879f9; }
-    .t-musk, .t-doge { color: #38bdf8; }
-
-    /* ════════════════════════════════════════════
-       SIDEBAR
-    ════════════════════════════════════════════ */
-    .sidebar-widget {
-      background: var(--surface);
-      border: 1px solid var(--border);
-      border-radius: var(--radius);
-      overflow: hidden;
-      margin-bottom: 16px;
-    }
-    .widget-head {
-      font-size: 11px; font-weight: 800; letter-spacing: .1em;
-      text-transform: uppercase; font-family: system-ui;
-      padding: 10px 14px; border-bottom: 1px solid var(--border);
-      color: var(--muted);
-    }
-    .topic-row {
-      display: flex; align-items: center; justify-content: space-between;
-      padding: 8px 14px; border-bottom: 1px solid var(--border);
-      font-size: 13px; font-family: system-ui;
-      transition: background .1s;
-    }
-    .topic-row:last-child { border-bottom: none; }
-    .topic-row:hover { background: var(--surface2); }
-    .topic-row a { color: var(--text2); font-weight: 600; }
-    .topic-row a:hover { color: var(--text); }
-    .topic-count {
-      font-size: 11px; color: var(--muted);
-      background: var(--surface2); padding: 2px 7px; border-radius: 999px;
-    }
-    .ad-rect {
-      background: var(--surface2); border: 1px dashed var(--border2);
-      border-radius: var(--radius); height: 250px;
-      display: flex; align-items: center; justify-content: center;
-      color: var(--muted); font-size: 11px; font-family: system-ui;
-      margin-bottom: 16px;
-    }
-
-    /* ════════════════════════════════════════════
-       LOAD MORE
-    ════════════════════════════════════════════ */
-    .load-wrap { grid-column: 1/-1; text-align: center; margin-top: 24px; }
-    #loadMore {
-      padding: 11px 32px; border-radius: var(--radius);
-      background: var(--surface); border: 1px solid var(--border2);
-      color: var(--text); font-weight: 700; font-size: 13px;
-      font-family: system-ui; cursor: pointer; transition: all .15s;
-    }
-    #loadMore:hover { border-color: var(--accent); color: var(--accent); }
-    #loadStatus { font-size: 12px; color: var(--muted); margin-top: 8px; font-family: system-ui; }
-
-    /* ════════════════════════════════════════════
-       EMPTY
-    ════════════════════════════════════════════ */
-    .empty {
-      grid-column: 1/-1;
-      text-align: center; padding: 80px 20px;
-      color: var(--muted); font-family: system-ui;
-    }
-    .empty strong { display: block; font-size: 20px; margin-bottom: 8px; color: var(--text); }
-  </style>
+  <link rel="stylesheet" href="{{ url_for('site_css', v=css_version) }}"/>
 </head>
 <body>
+{#- ── Shared partials ── #}
+{%- macro topic_cls(topic) -%}
+  {{ ('t-' + topic|lower|replace(' / ','_')|replace(' ','-')|replace('/','')) if topic else '' }}
+{%- endmacro -%}
+{%- macro tone_cls(topic) -%}
+  {%- set tl = (topic or '')|lower -%}
+  {%- if 'russia' in tl or 'ukraine' in tl or 'nato' in tl or 'putin' in tl or 'zelensky' in tl or 'brics' in tl %}tc-blue
+  {%- elif 'israel' in tl or 'gaza' in tl or 'iran' in tl or 'netanyahu' in tl or 'saudi' in tl %}tc-purple
+  {%- elif 'china' in tl or 'taiwan' in tl or 'korea' in tl %}tc-orange
+  {%- elif 'bitcoin' in tl or 'crypto' in tl or 'cbdc' in tl or 'economy' in tl or 'federal' in tl %}tc-green
+  {%- elif 'military' in tl or 'pentagon' in tl %}tc-steel
+  {%- elif 'musk' in tl or 'doge' in tl %}tc-sky
+  {%- elif 'ufo' in tl or 'uap' in tl %}tc-pink
+  {%- endif -%}
+{%- endmacro -%}
+{%- macro card(s) -%}
+<article class="card{% if not s.image_url %} no-img {{ tone_cls(s.topic) }}{% endif %}">
+{%- if s.image_url %}<div class="card-img"><img src="{{ s.image_url }}" alt="{{ s.title }}" loading="lazy"/></div>{% endif -%}
+<div class="card-body">
+<div style="display:flex;align-items:center;gap:6px;margin-bottom:9px;">
+{%- if s.topic %}<span class="card-topic-badge {{ topic_cls(s.topic) }}">{{ s.topic }}</span>{% endif -%}
+{%- if s.is_breaking %}<span class="badge-breaking" style="font-size:9px;padding:2px 6px;">Breaking</span>
+{%- elif s.is_new %}<span class="new-dot" title="Recent"></span>{% endif -%}
+</div>
+<h2><a href="{{ s.link }}" target="_blank" rel="noopener noreferrer">{{ s.title }}</a></h2>
+{%- if s.summary %}<div class="card-summary">{{ s.summary }}</div>{% endif -%}
+<div class="card-meta"><span class="card-source">{{ s.source }}</span><span class="card-dot">·</span><span>{{ s.added_at }}</span></div>
+</div>
+</article>
+{%- endmacro %}
 
 <!-- ═══════════════ MASTHEAD ═══════════════ -->
 <header class="masthead">
@@ -832,7 +1238,7 @@ BASE_HTML = r"""
       <div class="site-name">News<em>Wire</em></div>
       <div class="masthead-tagline">
         {{ total_topics }} topics · {{ feed_count }} sources
-        {% if last_updated %}· <span id="last-updated" data-utc="{{ last_updated }}"></span>{% endif %}
+        {% if last_updated %}· <span id="last-updated" class="js-local-dt" data-utc="{{ last_updated }}"></span>{% endif %}
       </div>
     </div>
     <div class="masthead-right">
@@ -864,11 +1270,7 @@ BASE_HTML = r"""
   <nav class="topic-nav">
     <div class="topic-nav-scroll">
       <div class="topic-nav-inner">
-        <a class="tnav-pill {% if not active_topic %}active{% endif %}" href="{{ url_for('home') }}">All</a>
-        {% for t in nav_topics %}
-          <a class="tnav-pill {% if active_topic and active_topic|lower == t|lower %}active{% endif %}"
-             href="{{ url_for('topic_page', topic=t) }}">{{ t }}</a>
-        {% endfor %}
+        {{ nav_html|safe }}
       </div>
     </div>
   </nav>
@@ -883,7 +1285,7 @@ BASE_HTML = r"""
       <div>
         <div class="hero-badges">
           {% if hero.is_breaking %}<span class="badge-breaking">Breaking</span>{% elif hero.is_new %}<span class="badge-new">New</span>{% endif %}
-          <span class="badge-topic {{ ('t-' + hero.topic|lower|replace(' / ','_')|replace(' ','-')|replace('/','')) if hero.topic else '' }}">{{ hero.topic }}</span>
+          <span class="badge-topic {{ topic_cls(hero.topic) }}">{{ hero.topic }}</span>
         </div>
         <h1><a href="{{ hero.link }}" target="_blank" rel="noopener noreferrer">{{ hero.title }}</a></h1>
         {% if hero.summary %}
@@ -928,45 +1330,7 @@ BASE_HTML = r"""
 
       <div class="story-grid" id="stories">
         {% if stories %}
-          {% for s in stories %}
-          {% set tc = '' %}
-          {% if s.topic %}
-            {% set tl = s.topic|lower %}
-            {% if 'russia' in tl or 'ukraine' in tl or 'nato' in tl or 'putin' in tl or 'zelensky' in tl or 'brics' in tl %}{% set tc = 'tc-blue' %}
-            {% elif 'israel' in tl or 'gaza' in tl or 'iran' in tl or 'netanyahu' in tl or 'saudi' in tl %}{% set tc = 'tc-purple' %}
-            {% elif 'china' in tl or 'taiwan' in tl or 'korea' in tl %}{% set tc = 'tc-orange' %}
-            {% elif 'bitcoin' in tl or 'crypto' in tl or 'cbdc' in tl or 'economy' in tl or 'federal' in tl %}{% set tc = 'tc-green' %}
-            {% elif 'military' in tl or 'pentagon' in tl %}{% set tc = 'tc-steel' %}
-            {% elif 'musk' in tl or 'doge' in tl %}{% set tc = 'tc-sky' %}
-            {% elif 'ufo' in tl or 'uap' in tl %}{% set tc = 'tc-pink' %}
-            {% endif %}
-          {% endif %}
-          <article class="card {% if not s.image_url %}no-img {{ tc }}{% endif %}">
-            {% if s.image_url %}
-            <div class="card-img">
-              <img src="{{ s.image_url }}" alt="{{ s.title }}" loading="lazy"/>
-            </div>
-            {% endif %}
-            <div class="card-body">
-              <div style="display:flex;align-items:center;gap:6px;margin-bottom:9px;">
-                {% if s.topic %}
-                <span class="card-topic-badge {{ ('t-' + s.topic|lower|replace(' / ','_')|replace(' ','-')|replace('/','')) }}">{{ s.topic }}</span>
-                {% endif %}
-                {% if s.is_breaking %}<span class="badge-breaking" style="font-size:9px;padding:2px 6px;">Breaking</span>
-                {% elif s.is_new %}<span class="new-dot" title="Recent"></span>{% endif %}
-              </div>
-              <h2><a href="{{ s.link }}" target="_blank" rel="noopener noreferrer">{{ s.title }}</a></h2>
-              {% if s.summary %}
-                <div class="card-summary">{{ s.summary }}</div>
-              {% endif %}
-              <div class="card-meta">
-                <span class="card-source">{{ s.source }}</span>
-                <span class="card-dot">·</span>
-                <span>{{ s.added_at }}</span>
-              </div>
-            </div>
-          </article>
-          {% endfor %}
+          {% for s in stories %}{{ card(s) }}{% endfor %}
         {% else %}
           <div class="empty">
             <strong>No stories found</strong>
@@ -976,7 +1340,8 @@ BASE_HTML = r"""
       </div>
 
       <div class="load-wrap">
-        <button id="loadMore" data-page="{{ page }}" data-topic="{{ active_topic or '' }}" data-q="{{ q }}">
+        <button id="loadMore" data-page="{{ page }}" data-before="{{ cursor[0] }}" data-before-id="{{ cursor[1] }}" data-topic="{{ active_topic or '' }}" data-q="{{ q }}"
+                {% if not has_more %}style="display:none"{% endif %}>
           Load more stories
         </button>
         <div id="loadStatus"></div>
@@ -988,9 +1353,9 @@ BASE_HTML = r"""
       <div class="ad-rect">Advertisement</div>
       <div class="sidebar-widget">
         <div class="widget-head">Topics</div>
-        {% for t in all_topics %}
+        {% for t, href in topic_links %}
           <div class="topic-row">
-            <a href="{{ url_for('topic_page', topic=t) }}">{{ t }}</a>
+            <a href="{{ href }}">{{ t }}</a>
             {% if topic_counts.get(t) %}
               <span class="topic-count">{{ topic_counts[t] }}</span>
             {% endif %}
@@ -1014,13 +1379,12 @@ BASE_HTML = r"""
     localStorage.setItem('nw-theme', light ? 'light' : 'dark');
   });
 
-  // ── Last updated ──
-  const lu = document.getElementById('last-updated');
-  if (lu) {
-    try {
-      const d = new Date(lu.dataset.utc);
-      if (!isNaN(d)) lu.textContent = 'Updated ' + d.toLocaleTimeString(undefined, {hour:'numeric',minute:'2-digit',hour12:true});
-    } catch(_) {}
+  // ── Local timestamps (one formatter for every [data-utc] node) ──
+  const timeFmt = new Intl.DateTimeFormat(undefined, {hour:'numeric',minute:'2-digit',hour12:true});
+  const localTimes = document.getElementsByClassName('js-local-dt');
+  for (let i = 0; i < localTimes.length; i++) {
+    const d = new Date(localTimes[i].dataset.utc);
+    if (!isNaN(d)) localTimes[i].textContent = 'Updated ' + timeFmt.format(d);
   }
 
   // ── HTML escape ──
@@ -1081,6 +1445,10 @@ BASE_HTML = r"""
   loadBtn.addEventListener('click', async () => {
     const nextPage = parseInt(loadBtn.dataset.page || '1', 10) + 1;
     const params = new URLSearchParams({ page: nextPage });
+    if (loadBtn.dataset.before) {
+      params.set('before', loadBtn.dataset.before);
+      params.set('before_id', loadBtn.dataset.beforeId);
+    }
     if (loadBtn.dataset.topic) params.set('topic', loadBtn.dataset.topic);
     if (loadBtn.dataset.q)     params.set('q', loadBtn.dataset.q);
     loadBtn.disabled = true;
@@ -1095,7 +1463,10 @@ BASE_HTML = r"""
       }
       list.insertAdjacentHTML('beforeend', data.stories.map(renderCard).join(''));
       loadBtn.dataset.page = nextPage;
+      loadBtn.dataset.before = data.next_before || '';
+      loadBtn.dataset.beforeId = data.next_before_id || '';
       status.textContent = '';
+      if (!data.has_more) loadBtn.style.display = 'none';
     } catch (e) {
       status.textContent = 'Error loading. Try again.';
     } finally {
@@ -1107,35 +1478,73 @@ BASE_HTML = r"""
 </body>
 </html>
 """
+BASE_TMPL = app.jinja_env.from_string(BASE_HTML)
+
+# The nav bar only varies by which pill is active, so each variant is
+# rendered once and reused as a plain string.
+NAV_HTML = """
+{%- macro nav_pill(label, href, active) -%}
+  <a class="tnav-pill{% if active %} active{% endif %}" href="{{ href }}">{{ label }}</a>
+{%- endmacro -%}
+{{ nav_pill('All', url_for('home'), not active_topic) }}
+{%- for t in nav_topics %}{{ nav_pill(t, url_for('topic_page', topic=t), active_topic == t|lower) }}{% endfor %}
+"""
+NAV_TMPL = app.jinja_env.from_string(NAV_HTML)
+_NAV_KEYS = {t.lower() for t in NAV_TOPICS}
+_nav_fragments: dict = {}
+_topic_links: tuple = ()
 
 
 # ── Template helper ───────────────────────────────────────────────────────────
 
-def render(heading, stories, page, active_topic=None, q=""):
-    topic_counts = get_article_counts()
+def nav_html(active_topic=None):
+    """Nav pills for the given topic, rendered on first use and memoized."""
+    key = (active_topic or "").lower()
+    if key and key not in _NAV_KEYS:
+        key = "-"  # a topic outside the shortlist: no pill is active
+    frag = _nav_fragments.get(key)
+    if frag is None:
+        frag = NAV_TMPL.render(nav_topics=NAV_TOPICS, active_topic=key)
+        _nav_fragments[key] = frag
+    return frag
+
+
+def topic_links():
+    """(topic, href) pairs for the sidebar; the URLs never change."""
+    global _topic_links
+    if not _topic_links:
+        _topic_links = tuple((t, url_for("topic_page", topic=t)) for t in ALL_TOPICS)
+    return _topic_links
+
+
+def render(heading, stories, page, active_topic=None, q="", has_more=False, cursor=None,
+           last_updated="", topic_counts=None):
     # Pull hero from first story, rest go into the grid
     hero = stories[0] if stories else None
     grid = stories[1:] if stories else []
-    return render_template_string(
-        BASE_HTML,
+    return BASE_TMPL.render(
         page_title=f"{active_topic} – NewsWire" if active_topic else "NewsWire – Breaking News Aggregator",
         heading=heading,
         hero=hero,
         stories=grid,
         page=page,
+        has_more=has_more,
+        cursor=cursor or ("", ""),
         active_topic=active_topic,
         q=q,
-        all_topics=ALL_TOPICS,
-        nav_topics=NAV_TOPICS,
-        total_topics=len(ALL_TOPICS),
+        nav_html=nav_html(active_topic),
+        topic_links=topic_links(),
+        total_topics=TOTAL_TOPICS,
         feed_count=35,
-        last_updated=get_latest_update(),
-        topic_counts=topic_counts,
+        css_version=SITE_CSS_VERSION,
+        last_updated=last_updated,
+        topic_counts=topic_counts or {},
     )
 
 
 # ── Routes ────────────────────────────────────────────────────────────────────
 
+
 @app.before_request
 def _ensure_columns():
     ensure_image_column()
@@ -1144,7 +1553,15 @@ def _ensure_columns():
 
 @app.get("/health")
 def health():
-    return "ok", 200
+    return "ok", 200, {"Cache-Control": "no-store"}
+
+
+@app.get("/assets/site.css")
+def site_css():
+    resp = make_response(SITE_CSS)
+    resp.mimetype = "text/css"
+    resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return resp
 
 
 @app.get("/version")
@@ -1156,28 +1573,104 @@ def version():
 def api_stories():
     q     = request.args.get("q", "").strip() or None
     topic = request.args.get("topic", "").strip() or None
-    page  = max(int(request.args.get("page", "1") or "1"), 1)
-    limit = max(int(request.args.get("limit", str(PAGE_SIZE)) or PAGE_SIZE), 1)
-    rows  = get_stories(limit=limit, page=page, search=q, topic=topic)
-    return jsonify({"page": page, "count": len(rows), "stories": [serialize_story(r) for r in rows]})
+    page  = max(int(request.args.get("page", "1") or "1"), 1)  # deprecated: prefer ?before=
+    try:
+        before = parse_cursor(request.args)
+    except ValueError:
+        return jsonify({"error": "invalid before/before_id cursor"}), 400
+    limit = min(max(int(request.args.get("limit", str(PAGE_SIZE)) or PAGE_SIZE), 1), MAX_API_LIMIT)
+    etag  = page_etag(get_article_stats()[1], "api", q, topic, before or page, limit,
+                      "" if q else get_recent_view_latest())
+    if not_modified(etag):
+        return cacheable("", etag, 304)
+
+    def build():
+        rows, has_more = get_stories(limit=limit, page=page, search=q, topic=topic, before=before)
+        cursor = page_cursor(rows) or (None, None)
+        return dump_json({
+            "page": page, "count": len(rows), "has_more": has_more,
+            "next_before": cursor[0], "next_before_id": cursor[1],
+            "stories": serialize_stories(rows),
+        })
+    resp = cacheable(cached_page(etag, build), etag)
+    resp.mimetype = "application/json"
+    return resp
+
+
+def dump_json(obj):
+    """Encode an API body with orjson when it is installed, else Flask's json provider."""
+    return orjson.dumps(obj).decode() if orjson else app.json.dumps(obj)
+
+
+def page_etag(latest, *parts):
+    """ETag for a listing page: changes when new articles land (``latest`` is the
+    newest added_at from get_article_stats()), and once a minute so the
+    relative ages on the cards never go stale behind a 304. Pages that
+    articles_recent can serve also pass get_recent_view_latest() in ``parts``,
+    so their tag moves when the snapshot is refreshed, not only when the base
+    table changes."""
+    raw = "|".join(str(p) for p in (APP_BUILD, latest, int(time.time() // 60)) + parts)
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def not_modified(etag):
+    # Flask-Compress re-tags compressed bodies as "<etag>:<algorithm>"
+    return any(t == etag or t.startswith(etag + ":") for t in request.if_none_match)
+
+
+def cached_page(etag, build):
+    """Rendered body for a listing page or API call, shared by every visitor until its ETag
+    changes; ?nocache=1 forces a fresh render."""
+    key = ("page", etag)
+    body = None if request.args.get("nocache") == "1" else _cache_get(key, shared=True)
+    if body is None:
+        body = build()
+        _cache_set(key, body, ttl=60, shared=True)
+    return body
+
+
+def cacheable(body, etag, status=200):
+    if status == 200 and request.args.get("nocache") != "1":
+        g.page_etag = etag
+    resp = make_response(body, status)
+    resp.set_etag(etag)
+    # Shared caches may keep serving the old copy for a minute while they revalidate
+    resp.headers["Cache-Control"] = "public, max-age=30, stale-while-revalidate=60"
+    return resp
 
 
 @app.route("/")
 def home():
     q      = request.args.get("q", "").strip()
     page   = max(int(request.args.get("page", "1") or "1"), 1)
-    rows   = get_stories(limit=PAGE_SIZE, page=page, search=q or None)
-    stories = [serialize_story(r) for r in rows]
-    heading = f'Search results for "{q}"' if q else "Latest Stories"
-    return render(heading, stories, page, q=q)
+    counts, latest = get_article_stats()
+    etag   = page_etag(latest, "home", q, page, "" if q else get_recent_view_latest())
+    if not_modified(etag):
+        return cacheable("", etag, 304)
+
+    def build():
+        rows, has_more = get_stories(limit=PAGE_SIZE, page=page, search=q or None)
+        stories = serialize_stories(rows)
+        heading = f'Search results for "{q}"' if q else "Latest Stories"
+        return render(heading, stories, page, q=q, has_more=has_more, cursor=page_cursor(rows),
+                      last_updated=latest, topic_counts=counts)
+    return cacheable(cached_page(etag, build), etag)
 
 
 @app.route("/topic/<topic>")
 def topic_page(topic):
     page    = max(int(request.args.get("page", "1") or "1"), 1)
-    rows    = get_stories(limit=PAGE_SIZE, page=page, topic=topic)
-    stories = [serialize_story(r) for r in rows]
-    return render(f"{topic} News", stories, page, active_topic=topic)
+    counts, latest = get_article_stats()
+    etag    = page_etag(latest, "topic", topic, page, get_recent_view_latest())
+    if not_modified(etag):
+        return cacheable("", etag, 304)
+
+    def build():
+        rows, has_more = get_stories(limit=PAGE_SIZE, page=page, topic=topic)
+        stories = serialize_stories(rows)
+        return render(f"{topic} News", stories, page, active_topic=topic, has_more=has_more,
+                      cursor=page_cursor(rows), last_updated=latest, topic_counts=counts)
+    return cacheable(cached_page(etag, build), etag)
 
 
 # ── Daily Herold Brief ────────────────────────────────────────────────────────
@@ -1443,9 +1936,9 @@ BRIEF_HTML = r"""
 
   <div class="filter-row">
     <a class="fpill {% if not active_topic %}active{% endif %}" href="/brief">All</a>
-    {% for t in all_topics %}
-      <a class="fpill {% if active_topic and active_topic|lower == t|lower %}active{% endif %}"
-         href="/brief?topic={{ t }}">{{ t }}</a>
+    {% for t, key, href in brief_topics %}
+      <a class="fpill {% if active_topic == key %}active{% endif %}"
+         href="{{ href }}">{{ t }}</a>
     {% endfor %}
   </div>
 
@@ -1578,6 +2071,10 @@ function copyBrief(idx) {
 </body>
 </html>
 """
+BRIEF_TMPL = app.jinja_env.from_string(BRIEF_HTML)
+# (label, lowercase key, href) for the brief filter pills, so the template
+# compares plain strings instead of running |lower on 60 topics per render
+BRIEF_TOPICS = tuple((t, t.lower(), "/brief?topic=" + quote(t)) for t in ALL_TOPICS)
 
 
 SAVED_HTML = r"""
@@ -1714,6 +2211,7 @@ function copyCard(idx) {
 </body>
 </html>
 """
+SAVED_TMPL = app.jinja_env.from_string(SAVED_HTML)
 
 
 def brief_authed():
@@ -1726,32 +2224,32 @@ def brief():
         pw = request.form.get("password", "")
         if pw == BRIEF_PASSWORD:
             ensure_brief_columns()
-            resp = make_response(render_template_string(
-                BRIEF_HTML, authed=True, error=False,
+            resp = make_response(BRIEF_TMPL.render(
+                authed=True, error=False,
                 stories=_brief_stories(request.args.get("topic")),
-                all_topics=ALL_TOPICS,
-                active_topic=request.args.get("topic", ""),
+                brief_topics=BRIEF_TOPICS,
+                active_topic=request.args.get("topic", "").lower(),
             ))
             resp.set_cookie("brief_auth", BRIEF_PASSWORD, max_age=60*60*24*30, httponly=True)
             return resp
-        return render_template_string(BRIEF_HTML, authed=False, error=True)
+        return BRIEF_TMPL.render(authed=False, error=True)
 
     if not brief_authed():
-        return render_template_string(BRIEF_HTML, authed=False, error=False)
+        return BRIEF_TMPL.render(authed=False, error=False)
 
     ensure_brief_columns()
     topic = request.args.get("topic", "").strip() or None
     stories = _brief_stories(topic)
-    return render_template_string(
-        BRIEF_HTML, authed=True, error=False,
-        stories=stories, all_topics=ALL_TOPICS, active_topic=topic or "",
+    return BRIEF_TMPL.render(
+        authed=True, error=False,
+        stories=stories, brief_topics=BRIEF_TOPICS, active_topic=(topic or "").lower(),
     )
 
 
 @app.route("/brief/saved")
 def brief_saved():
     if not brief_authed():
-        return render_template_string(BRIEF_HTML, authed=False, error=False)
+        return BRIEF_TMPL.render(authed=False, error=False)
     ensure_brief_columns()
     rows = get_saved_briefs()
     saved = []
@@ -1779,12 +2277,12 @@ def brief_saved():
             "saved_brief": r.get("saved_brief") or "",
             "briefed_at": time_str,
         })
-    return render_template_string(SAVED_HTML, saved=saved)
+    return SAVED_TMPL.render(saved=saved)
 
 
 @app.post("/brief/logout")
 def brief_logout():
-    resp = make_response(render_template_string(BRIEF_HTML, authed=False, error=False))
+    resp = make_response(BRIEF_TMPL.render(authed=False, error=False))
     resp.delete_cookie("brief_auth")
     return resp
 
@@ -1798,10 +2296,8 @@ def api_brief():
     link = data.get("link", "")
 
     # Look up story from DB by link
-    tbl = "public.articles" if using_postgres() else "articles"
-    ph  = "%s" if using_postgres() else "?"
     rows = fetch_rows(
-        f"SELECT title, link, source, topic, summary, description FROM {tbl} WHERE link = {ph} LIMIT 1",
+        f"SELECT title, link, source, topic, summary, description FROM {ARTICLES} WHERE link = {PH} LIMIT 1",
         (link,)
     )
     if not rows:
@@ -1826,22 +2322,21 @@ def api_brief():
 
 def _brief_stories(topic=None):
     """Load stories for the brief page, score relevance, sort by score."""
-    tbl = "public.articles" if using_postgres() else "articles"
-    ph  = "%s" if using_postgres() else "?"
     if topic:
         rows = fetch_rows(
-            f"SELECT title,link,source,topic,summary,added_at,saved_brief "
-            f"FROM {tbl} WHERE lower(topic)=lower({ph}) ORDER BY added_at DESC LIMIT 40",
+            f"SELECT title,link,source,topic,summary,{ADDED_TS},saved_brief "
+            f"FROM {ARTICLES} WHERE lower(topic)=lower({PH}) ORDER BY added_at DESC LIMIT 40",
             (topic,)
         )
     else:
         rows = fetch_rows(
-            f"SELECT title,link,source,topic,summary,added_at,saved_brief "
-            f"FROM {tbl} ORDER BY added_at DESC LIMIT 40"
+            f"SELECT title,link,source,topic,summary,{ADDED_TS},saved_brief "
+            f"FROM {ARTICLES} ORDER BY added_at DESC LIMIT 40"
         )
     out = []
+    now = time.time()
     for r in rows:
-        s = serialize_story(r)
+        s = serialize_story(r, now)
         s["saved_brief"] = r.get("saved_brief") or ""
         s["relevance"] = score_relevance(s["title"], s["summary"], s["topic"], s["source"])
         out.append(s)
@@ -1851,4 +2346,5 @@ def _brief_stories(topic=None):
 
 
 if __name__ == "__main__":
-    app.run(debug=True, port=5000)
+    # Local development only; production runs under gunicorn (see Procfile)
+    app.run(debug=os.getenv("FLASK_DEBUG") == "1", port=int(os.getenv("PORT", "5000")), threaded=True)
@@ -3,10 +3,15 @@ import re
 import gc
 import time
 import html
+import json
 import hashlib
+import socket
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 import feedparser
 
@@ -24,8 +29,16 @@ except Exception:
 DATABASE_URL = os.getenv("DATABASE_URL")
 DB_PATH = os.getenv("DB_PATH", "news.db")
 POLL_SECONDS = int(os.getenv("POLL_SECONDS", "900"))  # 15 minutes default
+FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", "6"))  # feeds downloaded in parallel
+FETCH_TIMEOUT = 20  # seconds; feedparser has no timeout of its own
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+# The SDK retries 429s and 5xx itself with exponential backoff, honoring Retry-After
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "4"))
+OPENAI_TIMEOUT = 60  # seconds per request, so a stuck call can't stall the cycle
+
+# Rows kept in the public.articles_recent materialized view (Postgres only)
+RECENT_VIEW_ROWS = 2000
 
 # How similar two titles must be to count as the same story (0.0–1.0)
 TITLE_SIMILARITY_THRESHOLD = 0.82
@@ -172,16 +185,47 @@ def using_postgres():
     return bool(DATABASE_URL)
 
 
+_pg_conn = None
+
+
+@contextmanager
 def pg_connect():
+    """The collector's Postgres connection, opened once and reused across cycles.
+    A connection that errored out is dropped so the next call reconnects."""
+    global _pg_conn
     if psycopg is None:
         raise RuntimeError("psycopg not installed. Add psycopg[binary] to requirements.txt")
-    conn = psycopg.connect(DATABASE_URL, connect_timeout=5)
-    conn.autocommit = True
-    return conn
+    if _pg_conn is None or _pg_conn.closed or _pg_conn.broken:
+        _pg_conn = psycopg.connect(DATABASE_URL, connect_timeout=5, autocommit=True,
+                                   application_name="news_agg_collector")
+    try:
+        yield _pg_conn
+    except psycopg.OperationalError:
+        _pg_conn.close()
+        _pg_conn = None
+        raise
+
+
+# Applied once to the collector's connection; WAL lets the web app keep
+# reading while a cycle commits, and synchronous=NORMAL drops the per-commit fsync
+SQLITE_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=5000;
+"""
+_sqlite_conn = None
 
 
 def sqlite_connect():
-    return sqlite3.connect(DB_PATH)
+    """The collector's single SQLite connection, opened on first use and kept for the process."""
+    global _sqlite_conn
+    if _sqlite_conn is None:
+        _sqlite_conn = sqlite3.connect(DB_PATH)
+        _sqlite_conn.executescript(SQLITE_PRAGMAS)
+    return _sqlite_conn
 
 
 def init_db():
@@ -210,6 +254,39 @@ def init_db():
                 c.execute("CREATE UNIQUE INDEX IF NOT EXISTS articles_fingerprint_uniq ON public.articles (fingerprint);")
                 c.execute("CREATE INDEX IF NOT EXISTS articles_added_at_idx ON public.articles (added_at DESC);")
                 c.execute("CREATE INDEX IF NOT EXISTS articles_topic_idx ON public.articles (topic, added_at DESC);")
+                # Topic pages filter on lower(topic), which the plain topic index can't serve
+                c.execute("CREATE INDEX IF NOT EXISTS articles_topic_lower_idx ON public.articles (lower(topic), added_at DESC);")
+                # Trigram index for the web app's '%term%' search (expression must match app.SEARCH_DOC)
+                try:
+                    c.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+                    c.execute("""
+                        CREATE INDEX IF NOT EXISTS articles_search_trgm ON public.articles USING gin (
+                            (coalesce(title,'') || ' ' || coalesce(topic,'') || ' ' || coalesce(summary,''))
+                            gin_trgm_ops
+                        );
+                    """)
+                except Exception as e:
+                    print(f"[DB] pg_trgm search index skipped: {e}")
+                # Tokenised search for the web app (app.SQL_SEARCH_TSV); same document as above
+                try:
+                    c.execute("""
+                        ALTER TABLE public.articles ADD COLUMN IF NOT EXISTS search_tsv tsvector
+                        GENERATED ALWAYS AS (to_tsvector('simple',
+                            coalesce(title,'') || ' ' || coalesce(topic,'') || ' ' || coalesce(summary,'')
+                        )) STORED;
+                    """)
+                    c.execute("CREATE INDEX IF NOT EXISTS articles_search_tsv ON public.articles USING gin (search_tsv);")
+                except Exception as e:
+                    print(f"[DB] search_tsv column skipped: {e}")
+                # Small snapshot of the newest rows for the web app's unfiltered/topic pages
+                c.execute(f"""
+                    CREATE MATERIALIZED VIEW IF NOT EXISTS public.articles_recent AS
+                    SELECT id, title, link, source, topic, summary, added_at, image_url
+                    FROM public.articles ORDER BY added_at DESC LIMIT {RECENT_VIEW_ROWS};
+                """)
+                c.execute("CREATE UNIQUE INDEX IF NOT EXISTS articles_recent_id_uniq ON public.articles_recent (id);")
+                c.execute("CREATE INDEX IF NOT EXISTS articles_recent_added_at_idx ON public.articles_recent (added_at DESC);")
+                c.execute("CREATE INDEX IF NOT EXISTS articles_recent_topic_idx ON public.articles_recent (lower(topic), added_at DESC);")
     else:
         conn = sqlite_connect()
         c = conn.cursor()
@@ -235,19 +312,95 @@ def init_db():
             pass
         c.execute("CREATE INDEX IF NOT EXISTS articles_added_at_idx ON articles (added_at DESC);")
         c.execute("CREATE INDEX IF NOT EXISTS articles_topic_idx ON articles (topic, added_at DESC);")
+        c.execute("CREATE INDEX IF NOT EXISTS articles_topic_lower_idx ON articles (lower(topic), added_at DESC);")
+        try:
+            init_sqlite_fts(c)
+        except Exception as e:
+            print(f"[DB] FTS5 search index skipped: {e}")
         conn.commit()
-        conn.close()
+
+
+def init_sqlite_fts(c):
+    """Full-text index over title/topic/summary for the web app's search, kept in sync by triggers."""
+    c.execute("SELECT 1 FROM sqlite_master WHERE name = 'articles_fts';")
+    existed = c.fetchone() is not None
+    c.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts
+        USING fts5(title, topic, summary, content='articles', content_rowid='id');
+    """)
+    c.execute("""
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+            INSERT INTO articles_fts(rowid, title, topic, summary)
+            VALUES (new.id, new.title, new.topic, new.summary);
+        END;
+    """)
+    c.execute("""
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+            INSERT INTO articles_fts(articles_fts, rowid, title, topic, summary)
+            VALUES ('delete', old.id, old.title, old.topic, old.summary);
+        END;
+    """)
+    c.execute("""
+        CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE OF title, topic, summary ON articles BEGIN
+            INSERT INTO articles_fts(articles_fts, rowid, title, topic, summary)
+            VALUES ('delete', old.id, old.title, old.topic, old.summary);
+            INSERT INTO articles_fts(rowid, title, topic, summary)
+            VALUES (new.id, new.title, new.topic, new.summary);
+        END;
+    """)
+    if not existed:
+        # Index rows that were written before the FTS table existed
+        c.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild');")
+
+
+def refresh_recent_view():
+    """Re-snapshot public.articles_recent after a feed added rows (Postgres only)."""
+    if not using_postgres():
+        return
+    try:
+        with pg_connect() as conn:
+            with conn.cursor() as c:
+                c.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY public.articles_recent;")
+    except Exception as e:
+        print(f"[DB] articles_recent refresh failed: {e}")
+
+
+def analyze_articles():
+    """Refresh planner stats (and the PG visibility map) after new rows land."""
+    try:
+        if using_postgres():
+            with pg_connect() as conn:
+                with conn.cursor() as c:
+                    c.execute("VACUUM (ANALYZE) public.articles;")
+        else:
+            conn = sqlite_connect()
+            conn.execute("PRAGMA optimize;")
+    except Exception as e:
+        print(f"[DB] analyze failed: {e}")
 
 
 # ── Text utilities ───────────────────────────────────────────────────────────
 
+# Compiled once; these run on every entry of every feed on every poll
+_IMG_EXT_RE = re.compile(r"\.(jpg|jpeg|png|webp|gif)", re.I)
+_ENC_IMG_EXT_RE = re.compile(r"\.(jpg|jpeg|png|webp)", re.I)
+_IMG_TAG_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+# Whitespace plus the zero-width characters feeds like to pad titles with,
+# collapsed to one space in a single pass
+_SPACE_RE = re.compile(r"[\s\u200b\u200c\u200d\u2060\ufeff]+")
+_TRACKING_RE = re.compile(r"[?&](utm_\w+|ref|source|fbclid|gclid|campaign)=[^&]*")
+_NON_WORD_RE = re.compile(r"\W+")
+_SENTENCE_END_RE = re.compile(r"[.!?]\s+")
+
+
 def extract_image(entry):
     """Pull the best image URL out of an RSS entry."""
     # media:content
     for m in getattr(entry, "media_content", []) or []:
         url = m.get("url", "")
         if url and m.get("medium") in ("image", None):
-            if re.search(r"\.(jpg|jpeg|png|webp|gif)", url, re.I):
+            if _IMG_EXT_RE.search(url):
                 return url
     # media:thumbnail
     for m in getattr(entry, "media_thumbnail", []) or []:
@@ -257,11 +410,11 @@ def extract_image(entry):
     # enclosures
     for enc in getattr(entry, "enclosures", []) or []:
         if (enc.get("type", "").startswith("image/") or
-                re.search(r"\.(jpg|jpeg|png|webp)", enc.get("url", ""), re.I)):
+                _ENC_IMG_EXT_RE.search(enc.get("url", ""))):
             return enc.get("url", "") or ""
     # first <img> in description HTML
     desc = entry.get("description") or entry.get("summary") or ""
-    m = re.search(r'<img[^>]+src=["\']([^"\']+)["\']', desc, re.I)
+    m = _IMG_TAG_RE.search(desc)
     if m:
         url = m.group(1)
         if url.startswith("http"):
@@ -272,16 +425,14 @@ def extract_image(entry):
 def clean_text(text):
     if not text:
         return ""
-    text = re.sub(r"<[^>]+>", "", str(text))
-    text = html.unescape(text)
-    text = re.sub(r"[\xa0​‌‍⁠﻿]", " ", text)
-    return re.sub(r"\s+", " ", text).strip()
+    text = html.unescape(_TAG_RE.sub("", str(text)))
+    return _SPACE_RE.sub(" ", text).strip()
 
 
 def normalize_url(url):
     """Strip fragments and common tracking params for cleaner dedup."""
     url = (url or "").strip().split("#")[0]
-    url = re.sub(r"[?&](utm_\w+|ref|source|fbclid|gclid|campaign)=[^&]*", "", url)
+    url = _TRACKING_RE.sub("", url)
     return url.rstrip("?& /")
 
 
@@ -290,37 +441,79 @@ def make_fingerprint(url):
     return hashlib.md5(normalize_url(url).encode("utf-8", errors="ignore")).hexdigest()
 
 
+# Recent titles are compared against every new entry, so each one would be
+# re-normalized once per candidate without the cache
+@lru_cache(maxsize=4096)
 def normalize_for_compare(title):
-    t = clean_text(title).lower()
-    t = re.sub(r"[^\w\s]", " ", t)
-    return re.sub(r"\s+", " ", t).strip()
-
-
-def title_similarity(a, b):
-    return SequenceMatcher(None, normalize_for_compare(a), normalize_for_compare(b)).ratio()
+    return _NON_WORD_RE.sub(" ", clean_text(title).lower()).strip()
 
 
 # ── Deduplication ────────────────────────────────────────────────────────────
 
 def get_recent_titles(hours=24):
-    """Load titles from the last N hours to power similarity checks."""
+    """Titles from the last N hours, already run through normalize_for_compare(),
+    so the similarity scan never re-normalizes them."""
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
     if using_postgres():
         with pg_connect() as conn:
             with conn.cursor() as c:
                 c.execute("SELECT title FROM public.articles WHERE added_at > %s;", (cutoff,))
-                return [row[0] for row in c.fetchall() if row[0]]
-    conn = sqlite_connect()
-    c = conn.cursor()
-    c.execute("SELECT title FROM articles WHERE added_at > ?;", (cutoff.isoformat(),))
-    titles = [row[0] for row in c.fetchall() if row[0]]
-    conn.close()
-    return titles
+                rows = c.fetchall()
+    else:
+        c = sqlite_connect().execute("SELECT title FROM articles WHERE added_at > ?;", (cutoff.isoformat(),))
+        rows = c.fetchall()
+    return [normalize_for_compare(row[0]) for row in rows if row[0]]
+
+
+# Fingerprints known to be stored. Feeds repeat most entries poll after poll,
+# so those are answered here and only unseen ones reach the DB. Cleared when
+# it reaches the cap; the next cycles refill it from the DB.
+_stored_fingerprints = set()
+MAX_STORED_FINGERPRINTS = 50000
+
+
+def remember_fingerprint(fingerprint):
+    if len(_stored_fingerprints) >= MAX_STORED_FINGERPRINTS:
+        _stored_fingerprints.clear()
+    _stored_fingerprints.add(fingerprint)
+
+
+def existing_fingerprints(fingerprints):
+    """The subset of these fingerprints already stored, in at most one query per feed."""
+    fps = set(fingerprints)
+    known = fps & _stored_fingerprints
+    unseen = list(fps - known)
+    if not unseen:
+        return known
+    if using_postgres():
+        with pg_connect() as conn:
+            with conn.cursor() as c:
+                c.execute("SELECT fingerprint FROM public.articles WHERE fingerprint = ANY(%s);", (unseen,))
+                found = {row[0] for row in c.fetchall()}
+    else:
+        marks = ",".join("?" * len(unseen))
+        c = sqlite_connect().execute(f"SELECT fingerprint FROM articles WHERE fingerprint IN ({marks});", unseen)
+        found = {row[0] for row in c.fetchall()}
+    for fp in found:
+        remember_fingerprint(fp)
+    return known | found
 
 
 def is_duplicate_title(new_title, recent_titles):
+    """True if any recent title scores >= TITLE_SIMILARITY_THRESHOLD against this one.
+
+    recent_titles holds normalized titles (see get_recent_titles). The score is
+    SequenceMatcher(None, new, existing).ratio(), with one matcher reused for
+    the scan. The cheap upper bounds real_quick_ratio() and quick_ratio()
+    reject most pairs before the full ratio() runs.
+    """
+    sm = SequenceMatcher(None)
+    sm.set_seq1(normalize_for_compare(new_title))
     for existing in recent_titles:
-        if title_similarity(new_title, existing) >= TITLE_SIMILARITY_THRESHOLD:
+        sm.set_seq2(existing)
+        if (sm.real_quick_ratio() >= TITLE_SIMILARITY_THRESHOLD
+                and sm.quick_ratio() >= TITLE_SIMILARITY_THRESHOLD
+                and sm.ratio() >= TITLE_SIMILARITY_THRESHOLD):
             return True
     return False
 
@@ -331,11 +524,13 @@ def find_topic(title, desc):
     Broad/generic keywords must appear in the title to avoid junk matches.
     """
     norm_title = normalize_for_compare(title)
-    norm_desc  = clean_text(desc or "").lower()
+    # Title and description as one haystack: a single substring scan per key.
+    # No key contains a newline, so none can match across the join.
+    both = norm_title + "\n" + clean_text(desc or "").lower()
 
     # Strong keywords: title or description
     for key, label in TOPICS_STRONG.items():
-        if key in norm_title or key in norm_desc:
+        if key in both:
             return label
 
     # Broad keywords: title only
@@ -348,7 +543,9 @@ def find_topic(title, desc):
 
 # ── DB writes ────────────────────────────────────────────────────────────────
 
-def insert_article(title, link, source, desc, pub_date, topic_label, fingerprint, image_url=""):
+def insert_article(title, link, source, desc, pub_date, topic_label, fingerprint, image_url="", summary=None):
+    """Insert one article and return its id, or None if it already exists.
+    On SQLite the row is left uncommitted; commit_articles() ends the batch."""
     added_at = datetime.now(timezone.utc)
     if using_postgres():
         with pg_connect() as conn:
@@ -356,10 +553,10 @@ def insert_article(title, link, source, desc, pub_date, topic_label, fingerprint
                 c.execute("""
                     INSERT INTO public.articles
                         (title, link, source, description, pub_date, topic, summary, added_at, fingerprint, image_url)
-                    VALUES (%s, %s, %s, %s, %s, %s, NULL, %s, %s, %s)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     ON CONFLICT DO NOTHING
                     RETURNING id;
-                """, (title, link, source, desc, pub_date, topic_label, added_at, fingerprint, image_url or None))
+                """, (title, link, source, desc, pub_date, topic_label, summary, added_at, fingerprint, image_url or None))
                 row = c.fetchone()
                 return row[0] if row else None
     conn = sqlite_connect()
@@ -367,26 +564,32 @@ def insert_article(title, link, source, desc, pub_date, topic_label, fingerprint
     cur.execute("""
         INSERT OR IGNORE INTO articles
             (title, link, source, description, pub_date, topic, summary, added_at, fingerprint, image_url)
-        VALUES (?, ?, ?, ?, ?, ?, NULL, ?, ?, ?);
-    """, (title, link, source, desc, pub_date, topic_label, added_at.isoformat(), fingerprint, image_url or None))
-    conn.commit()
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+    """, (title, link, source, desc, pub_date, topic_label, summary, added_at.isoformat(), fingerprint, image_url or None))
     new_id = cur.lastrowid if cur.rowcount == 1 else None
-    conn.close()
     return new_id
 
 
-def update_summary(article_id, summary):
-    if not summary:
+def commit_articles():
+    """Commit a feed's SQLite inserts in one transaction (Postgres autocommits)."""
+    if not using_postgres():
+        sqlite_connect().commit()
+
+
+def update_summaries(rows):
+    """Store (article_id, summary) rows in one batch and commit."""
+    rows = [(summary, article_id) for article_id, summary in rows if summary]
+    if not rows:
         return
     if using_postgres():
         with pg_connect() as conn:
             with conn.cursor() as c:
-                c.execute("UPDATE public.articles SET summary = %s WHERE id = %s;", (summary, article_id))
+                # psycopg pipelines executemany: one round trip for the batch
+                c.executemany("UPDATE public.articles SET summary = %s WHERE id = %s;", rows)
         return
     conn = sqlite_connect()
-    conn.execute("UPDATE articles SET summary = ? WHERE id = ?;", (summary, article_id))
+    conn.executemany("UPDATE articles SET summary = ? WHERE id = ?;", rows)
     conn.commit()
-    conn.close()
 
 
 # ── AI summary ───────────────────────────────────────────────────────────────
@@ -394,10 +597,22 @@ def update_summary(article_id, summary):
 def get_openai_client():
     global _openai_client
     if _openai_client is None and OpenAI and OPENAI_API_KEY:
-        _openai_client = OpenAI(api_key=OPENAI_API_KEY)
+        _openai_client = OpenAI(api_key=OPENAI_API_KEY, max_retries=OPENAI_MAX_RETRIES,
+                                timeout=OPENAI_TIMEOUT)
     return _openai_client
 
 
+SUMMARY_FORMAT = """SUMMARY
+[1-2 sentences: what happened and why it matters]
+
+KEY POINTS
+• [most important fact]
+• [second fact, if it adds something new]
+• [third fact, only if genuinely useful]"""
+
+MAX_SUMMARY_BATCH = 8  # stories per request
+
+
 def ai_summary(title, desc, source, topic_label):
     client = get_openai_client()
     if not client:
@@ -412,18 +627,12 @@ Snippet: {desc}
 
 Respond in this exact plain-text format (no HTML, no markdown):
 
-SUMMARY
-[1-2 sentences: what happened and why it matters]
-
-KEY POINTS
-• [most important fact]
-• [second fact, if it adds something new]
-• [third fact, only if genuinely useful]
+{SUMMARY_FORMAT}
 
 If the snippet is thin, say so honestly. Omit bullet points you can't fill with real information."""
 
     try:
-        resp = get_openai_client().chat.completions.create(
+        resp = client.chat.completions.create(
             model=OPENAI_MODEL,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=250,
@@ -435,10 +644,67 @@ If the snippet is thin, say so honestly. Omit bullet points you can't fill with
         return None
 
 
+def ai_summaries(stories, source):
+    """Summaries for a feed's new (title, desc, topic_label) stories, in order.
+
+    Stories go to the model MAX_SUMMARY_BATCH at a time, so the instructions
+    are sent once per batch instead of once per story. A story the model
+    leaves out comes back as None, for the caller's fallback.
+    """
+    if not get_openai_client():
+        return [None] * len(stories)
+    if len(stories) == 1:
+        title, desc, topic_label = stories[0]
+        return [ai_summary(title, desc, source, topic_label)]
+    out = []
+    for i in range(0, len(stories), MAX_SUMMARY_BATCH):
+        out += _ai_summary_batch(stories[i:i + MAX_SUMMARY_BATCH], source)
+    return out
+
+
+def _ai_summary_batch(stories, source):
+    items = [
+        {"id": i, "topic": topic_label, "headline": title, "snippet": desc}
+        for i, (title, desc, topic_label) in enumerate(stories)
+    ]
+    prompt = f"""You are briefing a podcast host on several news stories from {source}. Be concise and sharp.
+
+Stories (JSON):
+{json.dumps(items, ensure_ascii=False)}
+
+Return a JSON object {{"summaries": [{{"id": <story id>, "text": <summary>}}, ...]}} with one entry per story.
+Each text is plain text (no HTML, no markdown) in this exact format:
+
+{SUMMARY_FORMAT}
+
+If a snippet is thin, say so honestly. Omit bullet points you can't fill with real information."""
+
+    try:
+        resp = get_openai_client().chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=250 * len(stories),
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+        data = json.loads(resp.choices[0].message.content or "{}")
+    except Exception as e:
+        print(f"  [AI ERROR] {e}")
+        return [None] * len(stories)
+
+    # Ids may come back as 0 or "0"; a malformed entry costs only its own story
+    by_id = {}
+    entries = data.get("summaries") if isinstance(data, dict) else None
+    for s in entries if isinstance(entries, list) else []:
+        if isinstance(s, dict) and isinstance(s.get("text"), str):
+            by_id[str(s.get("id"))] = s["text"].strip()
+    return [by_id.get(str(i)) or None for i in range(len(stories))]
+
+
 def fallback_summary(title, desc, topic_label):
     d = clean_text(desc or "")
     if d and len(d) > 60:
-        first_sentence = re.split(r"[.!?]\s+", d)[0].strip()
+        first_sentence = _SENTENCE_END_RE.split(d, 1)[0].strip()
         if first_sentence and first_sentence.lower() not in clean_text(title).lower():
             return f"SUMMARY\n{first_sentence}\n\nKEY POINTS\n• Topic: {topic_label}\n• Open the source link for full details."
     return f"SUMMARY\n{clean_text(title)}\n\nKEY POINTS\n• Topic: {topic_label}\n• Open the source link for full details."
@@ -448,67 +714,177 @@ def fallback_summary(title, desc, topic_label):
 
 MAX_ENTRIES_PER_FEED = 25  # cap to keep memory usage low on free tier
 
-def process_feed(feed_name, url, recent_titles):
-    print(f"[{feed_name}] Fetching...")
+# ETag / Last-Modified from each feed's last full response. Sent back on the
+# next poll so an unchanged feed answers 304 with nothing to download or parse.
+_feed_validators = {}
+# Earliest time (epoch seconds) a rate-limited feed may be polled again
+_feed_retry_at = {}
+# A feed that keeps answering 304 sits out cycles: 0, 1, then 3 after its
+# 1st, 2nd and later unchanged polls in a row, so at the default 15-minute
+# poll a quiet feed is still checked at least hourly. Any 200 resets it.
+MAX_IDLE_SKIP = 3
+_feed_unchanged = {}  # url -> consecutive 304s
+_feed_skip = {}       # url -> cycles left to sit out
+
+
+def retry_after_seconds(feed):
+    """Delay from a Retry-After header in whole seconds; 0 if absent or an HTTP date."""
     try:
-        feed = feedparser.parse(url)
-    except Exception as e:
-        print(f"  [FETCH ERROR] {e}")
+        return max(int((feed.get("headers") or {}).get("retry-after", 0)), 0)
+    except (TypeError, ValueError):
         return 0
 
-    entries = (getattr(feed, "entries", None) or [])[:MAX_ENTRIES_PER_FEED]
-    del feed  # release the full parsed feed object immediately
+
+def fetch_entries(feed_name, url):
+    """Download and parse one feed, keeping only the entries we process.
+    Runs on the fetch pool, so it must not touch the DB."""
+    if time.time() < _feed_retry_at.get(url, 0):
+        return []  # still backing off after a 429/503
+    if _feed_skip.get(url):
+        _feed_skip[url] -= 1
+        return []
+    etag, modified = _feed_validators.get(url, (None, None))
+    try:
+        feed = feedparser.parse(url, etag=etag, modified=modified)
+    except Exception as e:
+        print(f"[{feed_name}] [FETCH ERROR] {e}")
+        return []
+    status = getattr(feed, "status", None)
+    if status == 304:
+        idle = _feed_unchanged.get(url, 0) + 1
+        _feed_unchanged[url] = idle
+        _feed_skip[url] = min((1 << (idle - 1)) - 1, MAX_IDLE_SKIP)
+        return []
+    if status in (429, 503):
+        wait = retry_after_seconds(feed)
+        if wait:
+            _feed_retry_at[url] = time.time() + wait
+        print(f"[{feed_name}] [BACKOFF] HTTP {status}, retrying {f'in {wait}s' if wait else 'next cycle'}")
+        return []
+    _feed_unchanged.pop(url, None)
+    if feed.get("etag") or feed.get("modified"):
+        _feed_validators[url] = (feed.get("etag"), feed.get("modified"))
+    return (getattr(feed, "entries", None) or [])[:MAX_ENTRIES_PER_FEED]
+
+
+def process_feed(feed_name, url, recent_titles, entries=None):
+    print(f"[{feed_name}] Processing...")
+    if entries is None:
+        entries = fetch_entries(feed_name, url)
     new_count = 0
+    pending = []  # (id, title, desc, topic_label) inserted this feed, awaiting an AI summary
+    try:
+        known = existing_fingerprints(
+            make_fingerprint(normalize_url(e.get("link") or "")) for e in entries
+        )
+    except Exception as e:
+        print(f"  [DB] fingerprint lookup failed: {e}")
+        known = set()
 
     for entry in entries:
         try:
-            title = clean_text(entry.get("title") or "")
             link = normalize_url(entry.get("link") or "")
-            desc = clean_text(entry.get("description") or entry.get("summary") or "")
-            pub_date = str(entry.get("published") or entry.get("updated") or datetime.now(timezone.utc).isoformat())
+            if not link:
+                continue
 
-            if not title or not link:
+            # Primary dedup: URL fingerprint (same article from two feeds = one row).
+            # Checked before any text cleanup: most entries were seen on an earlier poll.
+            fp = make_fingerprint(link)
+            if fp in known:
+                # Still register the title: the stored row may be older than the
+                # recent-titles window, and another feed's copy of it under a
+                # different URL must still be caught by the similarity check.
+                known_title = normalize_for_compare(clean_text(entry.get("title") or ""))
+                if known_title:
+                    recent_titles.append(known_title)
                 continue
 
+            title = clean_text(entry.get("title") or "")
+            if not title:
+                continue
+            desc = clean_text(entry.get("description") or entry.get("summary") or "")
+            pub_date = str(entry.get("published") or entry.get("updated") or datetime.now(timezone.utc).isoformat())
+
             # One topic per article — first match wins
             topic_label = find_topic(title, desc)
             if not topic_label:
                 continue
 
-            # Primary dedup: URL fingerprint (same article from two feeds = one row)
-            fp = make_fingerprint(link)
-
             # Secondary dedup: title similarity catches same story, different URL/wording
             if is_duplicate_title(title, recent_titles):
                 continue
 
             image_url = extract_image(entry)
-            new_id = insert_article(title, link, feed_name, desc, pub_date, topic_label, fp, image_url)
+            # Stored with the fallback summary: on Postgres the row is visible as
+            # soon as it is inserted, before the model has answered
+            new_id = insert_article(title, link, feed_name, desc, pub_date, topic_label, fp, image_url,
+                                    fallback_summary(title, desc, topic_label))
+            remember_fingerprint(fp)  # stored now, or already was (conflict)
 
             if not new_id:
-                # URL already in DB — still register title so this cycle's similarity check works
-                recent_titles.append(title)
-                continue
+                continue  # the unique index says it is stored after all (e.g. listed twice in this feed)
 
             # Add to in-memory list immediately so the next feed doesn't duplicate it
-            recent_titles.append(title)
+            recent_titles.append(normalize_for_compare(title))
 
             print(f"  [NEW] ({topic_label}) {title[:72]}")
-            summary = ai_summary(title, desc, feed_name, topic_label) or fallback_summary(title, desc, topic_label)
-
-            update_summary(new_id, summary)
+            pending.append((new_id, title, desc, topic_label))
             new_count += 1
 
         except Exception as e:
             print(f"  [ENTRY ERROR] {e}")
 
+    try:
+        commit_articles()
+        # Summarize the feed's new stories together: one model request per batch, not per story.
+        # A story the model skipped keeps its fallback (update_summaries drops None).
+        summaries = ai_summaries([(t, d, tl) for _, t, d, tl in pending], feed_name)
+        update_summaries([(new_id, summary) for (new_id, _, _, _), summary in zip(pending, summaries)])
+    except Exception as e:
+        print(f"  [DB] saving {feed_name} failed: {e}")
+
     print(f"  → {new_count} new articles from {feed_name}")
     return new_count
 
 
+MAX_BACKFILL_SUMMARIES = 40  # rows per cycle, newest first
+
+
+def backfill_summaries(limit=MAX_BACKFILL_SUMMARIES):
+    """Summarize the newest rows whose summary is NULL: rows inserted before
+    inserts carried a fallback, or cleared by the cleanup scripts. Returns the
+    number of rows filled."""
+    if using_postgres():
+        with pg_connect() as conn:
+            with conn.cursor() as c:
+                c.execute("""
+                    SELECT id, title, description, topic, source FROM public.articles
+                    WHERE summary IS NULL ORDER BY added_at DESC LIMIT %s;
+                """, (limit,))
+                rows = c.fetchall()
+    else:
+        rows = sqlite_connect().execute("""
+            SELECT id, title, description, topic, source FROM articles
+            WHERE summary IS NULL ORDER BY added_at DESC LIMIT ?;
+        """, (limit,)).fetchall()
+
+    # ai_summaries() names one source per request, so batch by source
+    by_source = {}
+    for article_id, title, desc, topic_label, source in rows:
+        by_source.setdefault(source or "", []).append((article_id, title or "", desc or "", topic_label or ""))
+    filled = []
+    for source, stories in by_source.items():
+        summaries = ai_summaries([(t, d, tl) for _, t, d, tl in stories], source)
+        for (article_id, title, desc, topic_label), summary in zip(stories, summaries):
+            filled.append((article_id, summary or fallback_summary(title, desc, topic_label)))
+    update_summaries(filled)
+    return len(filled)
+
+
 # ── Main loop ────────────────────────────────────────────────────────────────
 
 def main():
+    socket.setdefaulttimeout(FETCH_TIMEOUT)
     init_db()
     db_label = "Postgres" if using_postgres() else f"SQLite ({DB_PATH})"
     ai_label = f"OpenAI {OPENAI_MODEL}" if OPENAI_API_KEY and OpenAI else "fallback (no API key)"
@@ -524,10 +900,26 @@ def main():
             stamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
             print(f"\n─── Cycle: {stamp} ───")
             recent_titles = get_recent_titles(hours=24)
+            try:
+                if backfill_summaries():
+                    refresh_recent_view()
+            except Exception as e:
+                print(f"  [DB] summary backfill failed: {e}")
             total = 0
-            for f in FEEDS:
-                total += process_feed(f["name"], f["url"], recent_titles)
-                gc.collect()  # free memory between feeds
+            # Downloads overlap on the pool; DB writes and dedup stay on this
+            # thread, in feed order, as each download completes
+            with ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="fetch") as pool:
+                fetched = pool.map(lambda f: fetch_entries(f["name"], f["url"]), FEEDS)
+                for f, entries in zip(FEEDS, fetched):
+                    added = process_feed(f["name"], f["url"], recent_titles, entries)
+                    if added:
+                        # Re-snapshot now, not at cycle end, so shallow pages show each
+                        # feed's stories as it lands; the web app's ETag follows the view
+                        refresh_recent_view()
+                    total += added
+                    gc.collect()  # free memory between feeds
+            if total:
+                analyze_articles()
             print(f"─── Done. {total} new articles. Next run in {POLL_SECONDS}s ───\n")
             time.sleep(POLL_SECONDS)
         except KeyboardInterrupt:
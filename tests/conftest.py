@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+
+# app and collector read DB_PATH at import, so point them at one scratch DB
+# before any test module imports them
+os.environ["DB_PATH"] = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ.pop("DATABASE_URL", None)
+os.environ.pop("REDIS_URL", None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
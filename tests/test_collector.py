@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+from difflib import SequenceMatcher
+
+import pytest
+
+import collector
+
+
+@pytest.fixture
+def db(monkeypatch, tmp_path):
+    """A fresh SQLite DB per test, so these rows never reach the pagination tests."""
+    monkeypatch.setattr(collector, "DB_PATH", str(tmp_path / "collector.db"))
+    monkeypatch.setattr(collector, "_sqlite_conn", None)
+    monkeypatch.setattr(collector, "_stored_fingerprints", set())
+    monkeypatch.setattr(collector, "OPENAI_API_KEY", None)
+    monkeypatch.setattr(collector, "_openai_client", None)
+    collector.init_db()
+    conn = collector.sqlite_connect()
+    yield conn
+    conn.close()
+
+
+def entry(title, link):
+    return {"title": title, "link": link, "description": "Officials spoke on Monday."}
+
+
+def test_stored_story_outside_window_blocks_cross_feed_copy(db):
+    title = "Trump signs executive order on steel tariffs"
+    link = collector.normalize_url("https://a.example.com/steel")
+    collector.insert_article(title, link, "Feed A", "", "", "Trump", collector.make_fingerprint(link), "")
+    collector.commit_articles()
+    # Stored two days ago, so get_recent_titles() (last 24h) does not return it
+    old = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
+    db.execute("UPDATE articles SET added_at = ?", (old,))
+    db.commit()
+    recent = collector.get_recent_titles()
+    assert recent == []
+
+    assert collector.process_feed("Feed A", "", recent, entries=[entry(title, link)]) == 0
+    copy = entry("Trump signs executive order on steel tariffs - Feed B", "https://b.example.com/other")
+    assert collector.process_feed("Feed B", "", recent, entries=[copy]) == 0
+    assert db.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 1
+
+
+def test_new_rows_are_stored_with_a_summary(db, monkeypatch):
+    seen = []
+
+    def no_model(stories, source):
+        # The model runs after the rows are committed: they must already have one
+        seen.extend(db.execute("SELECT summary FROM articles").fetchall())
+        return [None] * len(stories)
+
+    monkeypatch.setattr(collector, "ai_summaries", no_model)
+    added = collector.process_feed("Feed A", "", [], entries=[
+        entry("Trump signs executive order on steel tariffs", "https://a.example.com/steel"),
+        entry("Bitcoin tops $100,000 for the first time", "https://a.example.com/btc"),
+    ])
+    assert added == 2
+    assert seen and all(summary for summary, in seen)
+    assert db.execute("SELECT COUNT(*) FROM articles WHERE summary IS NULL").fetchone()[0] == 0
+
+
+def test_backfill_fills_null_summaries(db):
+    for i in range(3):
+        link = f"https://a.example.com/{i}"
+        collector.insert_article(f"Trump story {i}", link, "Feed A", "", "", "Trump",
+                                 collector.make_fingerprint(link), "")
+    collector.commit_articles()
+    assert collector.backfill_summaries() == 3
+    assert db.execute("SELECT COUNT(*) FROM articles WHERE summary IS NULL").fetchone()[0] == 0
+    assert collector.backfill_summaries() == 0
+
+
+# Long pairs: past 200 characters difflib's autojunk kicks in, and the
+# score then depends on which title is the first sequence
+TITLE_PAIRS = [
+    ("Trump signs executive order on steel tariffs",
+     "Trump signs executive order on steel tariffs - Reuters"),
+    ("Bitcoin tops $100,000 for the first time",
+     "Bitcoin tops $100K for first time as ETF inflows surge"),
+    ("Fed holds rates steady, signals two cuts this year",
+     "Senate passes stopgap bill to avert shutdown"),
+    ("Senate passes stopgap bill to avert shutdown",
+     "Senate passes stopgap funding bill, averting shutdown"),
+    ("rally bill vote shutdown stocks market stocks rates steel workers shutdown stocks senate "
+     "steel china fed senate report market vote jobs deal rally shutdown trump senate senate "
+     "senate rates price senate steel inflation workers",
+     "rally jobs vote shutdown stocks market stocks rates steel workers shutdown stocks senate "
+     "steel tariffs fed senate report market vote jobs deal rally shutdown trump senate senate "
+     "senate rates price senate market inflation workers"),
+    ("stocks budget house report fed rally rally steel rates federal federal bitcoin deal senate "
+     "workers price price deal steel bitcoin tariffs rally tariffs market vote inflation price "
+     "fed jobs senate",
+     "stocks china house report fed rally price steel rates federal federal bitcoin deal senate "
+     "workers price deadline deal steel bitcoin tariffs rally tariffs market vote inflation "
+     "price stocks jobs senate"),
+]
+
+
+@pytest.mark.parametrize("new, existing", TITLE_PAIRS + [(b, a) for a, b in TITLE_PAIRS])
+def test_duplicate_verdict_matches_plain_ratio(new, existing):
+    norm = collector.normalize_for_compare
+    score = SequenceMatcher(None, norm(new), norm(existing)).ratio()
+    expected = score >= collector.TITLE_SIMILARITY_THRESHOLD
+    assert collector.is_duplicate_title(new, [norm(existing)]) == expected
+    # Same verdict when the match sits among other recent titles
+    others = [norm(a) for a, _ in TITLE_PAIRS if a not in (new, existing)]
+    assert collector.is_duplicate_title(new, others + [norm(existing)]) == (
+        expected or any(SequenceMatcher(None, norm(new), o).ratio() >= collector.TITLE_SIMILARITY_THRESHOLD
+                        for o in others))
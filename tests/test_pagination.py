@@ -0,0 +1,63 @@
+import pytest
+
+import collector
+import app
+
+LIMIT = 7
+
+
+@pytest.fixture(scope="module")
+def client():
+    collector.init_db()
+    for i in range(40):
+        topic = ("Trump", "Bitcoin")[i % 2]
+        link = f"https://example.com/{i}"
+        collector.insert_article(f"Story {i} {topic}", link, "Src", "desc", "", topic,
+                                 collector.make_fingerprint(link), "")
+    collector.commit_articles()
+    # A run of equal timestamps, so pages must fall back on the id tie-break
+    conn = collector.sqlite_connect()
+    tied = conn.execute("SELECT added_at FROM articles WHERE id = 20").fetchone()[0]
+    conn.execute("UPDATE articles SET added_at = ? WHERE id BETWEEN 15 AND 25", (tied,))
+    conn.commit()
+    return app.app.test_client()
+
+
+def get(client, **params):
+    resp = client.get("/api/stories", query_string={"limit": LIMIT, "nocache": 1, **params})
+    assert resp.status_code == 200, resp.get_data(as_text=True)
+    return resp.get_json()
+
+
+def titles(data):
+    return [s["title"] for s in data["stories"]]
+
+
+@pytest.mark.parametrize("extra", [{}, {"topic": "Trump"}, {"q": "Story"}])
+def test_keyset_page_two_matches_offset_page_two(client, extra):
+    first = get(client, **extra)
+    by_cursor = get(client, before=first["next_before"], before_id=first["next_before_id"], **extra)
+    by_offset = get(client, page=2, **extra)
+    assert titles(by_cursor) == titles(by_offset)
+    assert by_cursor["has_more"] == by_offset["has_more"]
+
+
+def test_cursor_walk_visits_every_story_once(client):
+    data, seen = get(client), []
+    seen += titles(data)
+    while data["has_more"]:
+        data = get(client, before=data["next_before"], before_id=data["next_before_id"])
+        seen += titles(data)
+    assert len(seen) == len(set(seen)) == 40
+
+
+@pytest.mark.parametrize("query", [
+    "before=not-a-date",
+    "before=2026-01-01T00:00:00+00:00",  # unencoded "+" decodes to a space
+    "before=2026-01-01T00:00:00Z&before_id=x",
+    "before=2026-01-01T00:00:00Z",  # before_id is required with before
+    "before=2026-01-01T00:00:00Z&before_id=",
+])
+def test_malformed_cursor_is_rejected(client, query):
+    resp = client.get(f"/api/stories?{query}")
+    assert resp.status_code == 400